@@ -15,7 +15,12 @@ from .settings import (
     UILabels,
     AxisLabels,
     EARTH_RADIUS_KM,
-    METERS_PER_DEGREE_LAT
+    EARTH_RADIUS_M,
+    METERS_PER_DEGREE_LAT,
+    INV_METERS_PER_DEGREE_LAT,
+    DEG2RAD,
+    RAD2DEG,
+    WAYPOINT_DTYPE
 )
 
 __version__ = "5.1.0"
@@ -30,7 +35,12 @@ __all__ = [
     'UILabels',
     'AxisLabels',
     'EARTH_RADIUS_KM',
-    'METERS_PER_DEGREE_LAT'
+    'EARTH_RADIUS_M',
+    'METERS_PER_DEGREE_LAT',
+    'INV_METERS_PER_DEGREE_LAT',
+    'DEG2RAD',
+    'RAD2DEG',
+    'WAYPOINT_DTYPE'
 ]
 
 # ==================================================
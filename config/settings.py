@@ -5,13 +5,30 @@ Configuration classes and global constants for v5.1
 Enhanced with 6m spacing and professional settings
 """
 
+import math
+import sys
+import numpy as np
 from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
 
 # Earth coordinate constants
 EARTH_RADIUS_KM = 6371.0
+EARTH_RADIUS_M = 6_371_000.0
 METERS_PER_DEGREE_LAT = 111111.0
+INV_METERS_PER_DEGREE_LAT = 1.0 / METERS_PER_DEGREE_LAT
 
-@dataclass
+# Angle conversion factors
+DEG2RAD = math.pi / 180.0
+RAD2DEG = 180.0 / math.pi
+
+# Packed waypoint record (lat/lon in degrees, alt in meters, MAVLink command id)
+WAYPOINT_DTYPE = np.dtype([('lat', 'f8'), ('lon', 'f8'), ('alt', 'f8'), ('cmd', 'i2')])
+
+# dataclass(slots=True) requires Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SafetyConfig:
     """Safety configuration with enhanced parameters"""
     safety_distance: float = 5.0
@@ -19,7 +36,7 @@ class SafetyConfig:
     critical_distance: float = 3.0
     collision_check_interval: float = 0.1
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TakeoffConfig:
     """Takeoff configuration - Updated to 6m spacing for v5.1"""
     formation_spacing: float = 6.0  # Enhanced from 3.0 to 6.0 meters
@@ -27,14 +44,14 @@ class TakeoffConfig:
     hover_time: float = 2.0
     east_offset: float = 50.0
 
-class FlightPhase:
+class FlightPhase(IntEnum):
     """Flight phases enumeration"""
-    TAXI = "taxi"
-    TAKEOFF = "takeoff"
-    HOVER = "hover"
-    AUTO = "auto"
-    LOITER = "loiter"
-    LANDING = "landing"
+    TAXI = 0
+    TAKEOFF = 1
+    HOVER = 2
+    AUTO = 3
+    LOITER = 4
+    LANDING = 5
 
 class SimulatorConfig:
     """Simulator configuration constants"""
@@ -44,6 +61,9 @@ class SimulatorConfig:
     
     # Performance optimization
     UPDATE_INTERVAL = 33  # ~30fps
+    SIMULATION_TIMESTEP = 1 / 60  # Seconds of simulated time per step; playback advances in whole steps
+    STATUS_UPDATE_INTERVAL = 0.1  # Seconds between status text refreshes while playing
+    PLOT_UPDATE_INTERVAL = 0.025  # Minimum seconds between 3D plot updates while playing
     MAX_DRONES = 4
     
     # UI configuration
@@ -56,6 +76,9 @@ class SimulatorConfig:
     # 3D plot configuration
     FIGURE_SIZE = (18, 12)
     DPI = 100
+    INTERACTIVE_DPI = 80  # On-screen rendering; exports pass their own dpi to save_plot
+    MOTION_SIMPLIFY_THRESHOLD = 0.5  # Path simplification while zooming/rotating
+    MOTION_SETTLE_MS = 200  # Idle time before full quality is restored
     
     # Animation configuration
     DEFAULT_CRUISE_SPEED = 8.0  # m/s
@@ -65,10 +88,11 @@ class SimulatorConfig:
     # File export settings
     COLLISION_LOG_PREFIX = "collision_log"
     MISSION_FILE_PREFIX = "modified"
+    MISSION_ARCHIVE_PREFIX = "missions"
     EXPORT_ENCODING = "utf-8"
     
     # UI Colors (Dark theme)
-    UI_COLORS = {
+    UI_COLORS = MappingProxyType({
         'background': '#1e1e1e',
         'panel': '#2d2d2d',
         'accent': '#00d4aa',
@@ -77,28 +101,32 @@ class SimulatorConfig:
         'warning': '#ffc107',
         'danger': '#f44336',
         'info': '#17a2b8'
-    }
+    })
     
     # Button configurations
-    BUTTON_CONFIGS = {
-        'play': {'bg': '#28a745', 'fg': 'white'},
-        'pause': {'bg': '#ffc107', 'fg': 'black'},
-        'stop': {'bg': '#dc3545', 'fg': 'white'},
-        'reset': {'bg': '#ffc107', 'fg': 'black'},
-        'export': {'bg': '#17a2b8', 'fg': 'white'},
-        'log': {'bg': '#e83e8c', 'fg': 'white'}
-    }
+    BUTTON_CONFIGS = MappingProxyType({
+        'play': MappingProxyType({'bg': '#28a745', 'fg': 'white'}),
+        'pause': MappingProxyType({'bg': '#ffc107', 'fg': 'black'}),
+        'stop': MappingProxyType({'bg': '#dc3545', 'fg': 'white'}),
+        'reset': MappingProxyType({'bg': '#ffc107', 'fg': 'black'}),
+        'export': MappingProxyType({'bg': '#17a2b8', 'fg': 'white'}),
+        'log': MappingProxyType({'bg': '#e83e8c', 'fg': 'white'})
+    })
 
 class CollisionLogConfig:
     """Collision logging configuration"""
     # Log file settings
     FILE_EXTENSION = ".json"
+    NDJSON_EXTENSION = ".ndjson"  # Exports with this extension hold one JSON record per line
     TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
     
     # JSON export settings
     INDENT = 2
     ENSURE_ASCII = False
     
+    # Seconds a still-running background export may delay interpreter exit
+    EXIT_FLUSH_TIMEOUT = 2.0
+    
     # Metadata fields
     METADATA_FIELDS = [
         'total_events',
@@ -156,14 +184,14 @@ class UILabels:
     ERROR = "Error"
     
     # Flight phases (display names)
-    PHASE_NAMES = {
+    PHASE_NAMES = MappingProxyType({
         FlightPhase.TAXI: "Ground Taxi",
         FlightPhase.TAKEOFF: "Taking Off",
         FlightPhase.HOVER: "Hover Wait",
         FlightPhase.AUTO: "Auto Mission",
         FlightPhase.LOITER: "Avoidance Wait",
         FlightPhase.LANDING: "Landing"
-    }
+    })
     
     # Menu items
     MENU_FILE = "File"
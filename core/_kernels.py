@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Numeric Kernels Module
+JIT-compiled trajectory kernels with NumPy fallbacks when numba is not installed
+"""
+
+import logging
+import numpy as np
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba not available, using NumPy kernels")
+
+
+def _interp_xyz_numpy(t_arr: np.ndarray, xyz_arr: np.ndarray,
+                      ts_out: np.ndarray, out_xyz: np.ndarray) -> None:
+    """
+    Linearly interpolate positions at sorted sample times (NumPy version)
+
+    Args:
+        t_arr: Trajectory point times, shape (N,)
+        xyz_arr: Trajectory point positions, shape (N, 3)
+        ts_out: Ascending sample times, shape (M,)
+        out_xyz: Output positions, shape (M, 3)
+    """
+    for k in range(3):
+        out_xyz[:, k] = np.interp(ts_out, t_arr, xyz_arr[:, k])
+
+
+def _pair_min_dist_sq_numpy(x1: np.ndarray, y1: np.ndarray, z1: np.ndarray,
+                            x2: np.ndarray, y2: np.ndarray, z2: np.ndarray,
+                            thresh_sq: float, out_idx: np.ndarray, out_d2: np.ndarray) -> int:
+    """
+    Find samples where two sampled trajectories are closer than a threshold (NumPy version)
+
+    Args:
+        x1, y1, z1: First trajectory sample coordinates, shape (M,)
+        x2, y2, z2: Second trajectory sample coordinates, shape (M,)
+        thresh_sq: Squared distance threshold
+        out_idx: Output sample indices of hits, shape (M,)
+        out_d2: Output squared distances of hits, shape (M,)
+
+    Returns:
+        Number of hits written to the output arrays
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    dz = z1 - z2
+    d2 = dx * dx + dy * dy + dz * dz
+    hits = np.flatnonzero(d2 < thresh_sq)
+    count = hits.size
+    out_idx[:count] = hits
+    out_d2[:count] = d2[hits]
+    return count
+
+
+def _batch_interp_numpy(cur_t: float, t_flat: np.ndarray, xyz_flat: np.ndarray,
+                        starts: np.ndarray, ends: np.ndarray,
+                        out_xyz: np.ndarray, out_count: np.ndarray) -> None:
+    """
+    Interpolate the positions of many trajectories at one time (NumPy version)
+
+    Trajectories are packed back to back in flat arrays; trajectory d occupies
+    the half-open range [starts[d], ends[d]) and must not be empty.
+
+    Args:
+        cur_t: Sample time
+        t_flat: Concatenated point times, shape (P,)
+        xyz_flat: Concatenated point positions, shape (P, 3)
+        starts: First point index of each trajectory, shape (D,)
+        ends: One past the last point index of each trajectory, shape (D,)
+        out_xyz: Output positions (clamped to the end points), shape (D, 3)
+        out_count: Output number of points at or before cur_t per trajectory, shape (D,)
+    """
+    for d in range(starts.shape[0]):
+        s, e = starts[d], ends[d]
+        k = int(np.searchsorted(t_flat[s:e], cur_t, side='right'))
+        out_count[d] = k
+        if k == 0:
+            out_xyz[d] = xyz_flat[s]
+        elif k == e - s:
+            out_xyz[d] = xyz_flat[e - 1]
+        else:
+            i = s + k - 1
+            ratio = (cur_t - t_flat[i]) / (t_flat[i + 1] - t_flat[i])
+            out_xyz[d] = xyz_flat[i] + ratio * (xyz_flat[i + 1] - xyz_flat[i])
+
+
+def _interp_loiter_numpy(cur_t: float, t_arr: np.ndarray, xyz_arr: np.ndarray,
+                         loiter_starts: np.ndarray, loiter_durs: np.ndarray,
+                         out_xyz: np.ndarray) -> Tuple[float, int]:
+    """
+    Interpolate one trajectory at a time shifted back by LOITER delays (NumPy version)
+
+    The first delay that has started holds the drone at its start time until the
+    delay has elapsed, then replays the trajectory shifted by its duration.
+
+    Args:
+        cur_t: Simulation time
+        t_arr: Trajectory point times, shape (N,), N >= 1
+        xyz_arr: Trajectory point positions, shape (N, 3)
+        loiter_starts: Delay start times in application order, shape (L,)
+        loiter_durs: Delay durations, shape (L,)
+        out_xyz: Output position, shape (3,); only written for interior times
+
+    Returns:
+        Tuple of (effective time, segment index); the index is -1 at or before the
+        first point, N - 1 at or after the last point, else the segment start
+    """
+    eff_t = cur_t
+    for k in range(loiter_starts.shape[0]):
+        if cur_t >= loiter_starts[k]:
+            eff_t = max(loiter_starts[k], cur_t - loiter_durs[k])
+            break
+
+    n = t_arr.shape[0]
+    if eff_t >= t_arr[n - 1]:
+        return eff_t, n - 1
+    if eff_t <= t_arr[0]:
+        return eff_t, -1
+
+    i = int(np.searchsorted(t_arr, eff_t, side='right')) - 1
+    ratio = (eff_t - t_arr[i]) / (t_arr[i + 1] - t_arr[i])
+    out_xyz[:] = xyz_arr[i] + ratio * (xyz_arr[i + 1] - xyz_arr[i])
+    return eff_t, i
+
+
+def _near_pairs_numpy(pos: np.ndarray, thresh_sq: float, out_i: np.ndarray,
+                      out_j: np.ndarray, out_d2: np.ndarray) -> int:
+    """
+    Find all position pairs closer than a threshold in one pass (NumPy version)
+
+    Args:
+        pos: Positions, shape (N, 3)
+        thresh_sq: Squared distance threshold (pairs at or under it are kept)
+        out_i: Output first indices, shape (>= N*(N-1)/2,)
+        out_j: Output second indices (i < j), shape (>= N*(N-1)/2,)
+        out_d2: Output squared distances, shape (>= N*(N-1)/2,)
+
+    Returns:
+        Number of pairs written to the output arrays, in lexicographic (i, j) order
+    """
+    iu, ju = np.triu_indices(pos.shape[0], 1)
+    diff = pos[iu] - pos[ju]
+    d2 = np.einsum('ij,ij->i', diff, diff)
+    hits = np.flatnonzero(d2 <= thresh_sq)
+    count = hits.size
+    out_i[:count] = iu[hits]
+    out_j[:count] = ju[hits]
+    out_d2[:count] = d2[hits]
+    return count
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _interp_xyz_jit(t_arr, xyz_arr, ts_out, out_xyz):
+        # Sample times are ascending, so the bracketing segment only moves forward
+        n = t_arr.shape[0]
+        j = 0
+        for m in range(ts_out.shape[0]):
+            ts = ts_out[m]
+            if ts <= t_arr[0]:
+                for k in range(3):
+                    out_xyz[m, k] = xyz_arr[0, k]
+                continue
+            if ts >= t_arr[n - 1]:
+                for k in range(3):
+                    out_xyz[m, k] = xyz_arr[n - 1, k]
+                continue
+            while j < n - 2 and t_arr[j + 1] <= ts:
+                j += 1
+            ratio = (ts - t_arr[j]) / (t_arr[j + 1] - t_arr[j])
+            for k in range(3):
+                out_xyz[m, k] = xyz_arr[j, k] + ratio * (xyz_arr[j + 1, k] - xyz_arr[j, k])
+
+    @njit(cache=True, fastmath=True)
+    def _pair_min_dist_sq_jit(x1, y1, z1, x2, y2, z2, thresh_sq, out_idx, out_d2):
+        count = 0
+        for m in range(x1.shape[0]):
+            dx = x1[m] - x2[m]
+            dy = y1[m] - y2[m]
+            dz = z1[m] - z2[m]
+            d2 = dx * dx + dy * dy + dz * dz
+            if d2 < thresh_sq:
+                out_idx[count] = m
+                out_d2[count] = d2
+                count += 1
+        return count
+
+    @njit(cache=True, fastmath=True)
+    def _batch_interp_jit(cur_t, t_flat, xyz_flat, starts, ends, out_xyz, out_count):
+        for d in range(starts.shape[0]):
+            s = starts[d]
+            e = ends[d]
+            # Count of points at or before cur_t (upper-bound binary search)
+            lo = s
+            hi = e
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if t_flat[mid] <= cur_t:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            k = lo - s
+            out_count[d] = k
+            if k == 0:
+                for c in range(3):
+                    out_xyz[d, c] = xyz_flat[s, c]
+            elif lo == e:
+                for c in range(3):
+                    out_xyz[d, c] = xyz_flat[e - 1, c]
+            else:
+                i = lo - 1
+                ratio = (cur_t - t_flat[i]) / (t_flat[i + 1] - t_flat[i])
+                for c in range(3):
+                    out_xyz[d, c] = xyz_flat[i, c] + ratio * (xyz_flat[i + 1, c] - xyz_flat[i, c])
+
+    @njit(cache=True, fastmath=True)
+    def _interp_loiter_jit(cur_t, t_arr, xyz_arr, loiter_starts, loiter_durs, out_xyz):
+        eff_t = cur_t
+        for k in range(loiter_starts.shape[0]):
+            if cur_t >= loiter_starts[k]:
+                eff_t = max(loiter_starts[k], cur_t - loiter_durs[k])
+                break
+
+        n = t_arr.shape[0]
+        if eff_t >= t_arr[n - 1]:
+            return eff_t, n - 1
+        if eff_t <= t_arr[0]:
+            return eff_t, -1
+
+        # Last point at or before eff_t (upper-bound binary search)
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if t_arr[mid] <= eff_t:
+                lo = mid + 1
+            else:
+                hi = mid
+        i = lo - 1
+        ratio = (eff_t - t_arr[i]) / (t_arr[i + 1] - t_arr[i])
+        for c in range(3):
+            out_xyz[c] = xyz_arr[i, c] + ratio * (xyz_arr[i + 1, c] - xyz_arr[i, c])
+        return eff_t, i
+
+    @njit(cache=True, fastmath=True)
+    def _near_pairs_jit(pos, thresh_sq, out_i, out_j, out_d2):
+        count = 0
+        n = pos.shape[0]
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                dz = pos[i, 2] - pos[j, 2]
+                d2 = dx * dx + dy * dy + dz * dz
+                if d2 <= thresh_sq:
+                    out_i[count] = i
+                    out_j[count] = j
+                    out_d2[count] = d2
+                    count += 1
+        return count
+
+    interp_xyz = _interp_xyz_jit
+    pair_min_dist_sq = _pair_min_dist_sq_jit
+    batch_interp = _batch_interp_jit
+    interp_loiter = _interp_loiter_jit
+    near_pairs = _near_pairs_jit
+else:
+    interp_xyz = _interp_xyz_numpy
+    pair_min_dist_sq = _pair_min_dist_sq_numpy
+    batch_interp = _batch_interp_numpy
+    interp_loiter = _interp_loiter_numpy
+    near_pairs = _near_pairs_numpy
@@ -5,15 +5,21 @@ Advanced Collision Avoidance System with Precise Trajectory Analysis
 Enhanced with collision logging for v5.1
 """
 
-import math
+from math import sqrt, ceil, inf
 import logging
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from config.settings import SafetyConfig
 from core.collision_logger import CollisionLogger
+from core.trajectory import TrajectoryArrays, to_arrays
+from core._kernels import interp_xyz, pair_min_dist_sq, near_pairs
 
 logger = logging.getLogger(__name__)
 
+# Bounds of the adaptive trajectory sampling interval (seconds)
+MIN_SAMPLE_INTERVAL = 0.05
+MAX_SAMPLE_INTERVAL = 1.0
+
 class CollisionAvoidanceSystem:
     """
     Advanced collision avoidance system with precise trajectory analysis
@@ -26,7 +32,42 @@ class CollisionAvoidanceSystem:
         self.collision_warnings: List[Dict] = []
         self.trajectory_conflicts: List[Dict] = []
         
-        logger.info(f"Collision avoidance system initialized with safety distance: {self.config.safety_distance}m")
+        # Per-drone SoA trajectory arrays: drone_id -> (id(trajectory), len(trajectory), arrays)
+        self._traj_cache: Dict[str, Tuple[int, int, TrajectoryArrays]] = {}
+        
+        # Per-drone positions on the wait-time grid: drone_id -> (arrays, t_grid, xyz_grid)
+        self._wait_grid: Dict[str, Tuple[TrajectoryArrays, np.ndarray, np.ndarray]] = {}
+        
+        # Simulation time each drone pair was last logged by check_collisions
+        self._last_logged: Dict[Tuple[str, str], float] = {}
+        
+        self._cache_thresholds(safety_config)
+        
+        logger.info(f"Collision avoidance system initialized with safety distance: {self._safety}m")
+    
+    def _cache_thresholds(self, safety_config: SafetyConfig) -> None:
+        """
+        Cache distance thresholds as plain floats for the hot paths
+        
+        Args:
+            safety_config: Safety configuration to read thresholds from
+        """
+        self._safety = float(safety_config.safety_distance)
+        self._critical = float(safety_config.critical_distance)
+        
+        # Squared thresholds so distance checks can skip the sqrt
+        self._safety_sq = self._safety * self._safety
+        self._critical_sq = self._critical * self._critical
+        
+        # Pairs farther apart than this are considered separated again
+        rearm_distance = max(float(safety_config.warning_distance), self._safety)
+        self._rearm_sq = rearm_distance * rearm_distance
+        self._log_interval = float(safety_config.collision_check_interval)
+        
+        # Output buffers for the near-pair kernel, grown to N*(N-1)/2 on demand
+        self._pair_i = np.empty(0, dtype=np.int64)
+        self._pair_j = np.empty(0, dtype=np.int64)
+        self._pair_d2 = np.empty(0)
         
     def analyze_trajectory_conflicts(self, drones_data: Dict) -> List[Dict]:
         """
@@ -67,14 +108,14 @@ class CollisionAvoidanceSystem:
                     conflict['priority_drone'] = drone1  # Lower number has priority
                     conflict['waiting_drone'] = drone2   # Higher number waits
                     
-                    # Log collision event
-                    self.collision_logger.log_collision(conflict)
-                    
                 conflicts.extend(conflict_points)
                 
                 logger.info(f"Trajectory analysis: {drone1} vs {drone2} - "
                            f"Found {len(conflict_points)} potential conflicts")
         
+        # Log all collision events of this analysis in one batch
+        self.collision_logger.log_collisions_bulk(conflicts)
+        
         self.trajectory_conflicts = conflicts
         logger.info(f"Total trajectory conflicts found: {len(conflicts)}")
         
@@ -94,41 +135,138 @@ class CollisionAvoidanceSystem:
         """
         conflicts = []
         
-        # Sample entire trajectory at 0.5s intervals
-        max_time = max(traj1[-1]['time'], traj2[-1]['time'])
-        time_step = 0.5
+        arrays1 = self._get_trajectory_arrays(drone1, traj1)
+        arrays2 = self._get_trajectory_arrays(drone2, traj2)
+        t1, xyz1 = arrays1.t, arrays1.xyz
+        t2, xyz2 = arrays2.t, arrays2.xyz
+        
+        # Sample both trajectories more densely where they move fast relative to each other
+        max_time = max(t1[-1], t2[-1])
+        sample_times = self._adaptive_sample_times(arrays1, arrays2, max_time)
+        
+        # Interpolation clamps to the end points, matching the boundary handling
+        # of _interpolate_position
+        count = len(sample_times)
+        p1 = np.empty((count, 3))
+        p2 = np.empty((count, 3))
+        interp_xyz(t1, xyz1, sample_times, p1)
+        interp_xyz(t2, xyz2, sample_times, p2)
+        
+        hit_idx = np.empty(count, dtype=np.int64)
+        hit_d2 = np.empty(count)
+        hits = pair_min_dist_sq(p1[:, 0], p1[:, 1], p1[:, 2], p2[:, 0], p2[:, 1], p2[:, 2],
+                                self._safety_sq, hit_idx, hit_d2)
         
-        for t in np.arange(0, max_time, time_step):
-            pos1 = self._interpolate_position(traj1, t)
-            pos2 = self._interpolate_position(traj2, t)
+        hit_times = sample_times[hit_idx[:hits]]
+        
+        # Find corresponding waypoint indices for all conflict points at once
+        waypoints1 = self._find_nearest_waypoint_indices(arrays1, hit_times).tolist()
+        waypoints2 = self._find_nearest_waypoint_indices(arrays2, hit_times).tolist()
+        
+        # Only build conflict records for the samples inside the safety distance
+        for t, distance_sq, waypoint1_idx, waypoint2_idx in zip(
+                hit_times, hit_d2[:hits].tolist(), waypoints1, waypoints2):
+            distance = sqrt(distance_sq)
+            pos1 = self._interpolate_position(traj1, t, drone1)
+            pos2 = self._interpolate_position(traj2, t, drone2)
             
-            if pos1 and pos2:
-                distance = self._calculate_distance_3d(pos1, pos2)
-                
-                if distance < self.config.safety_distance:
-                    # Find corresponding waypoint indices for conflict point
-                    waypoint1_idx = self._find_nearest_waypoint_index(traj1, t)
-                    waypoint2_idx = self._find_nearest_waypoint_index(traj2, t)
-                    
-                    conflict = {
-                        'time': t,
-                        'distance': distance,
-                        'drone1': drone1,
-                        'drone2': drone2,
-                        'position1': pos1,
-                        'position2': pos2,
-                        'waypoint1_index': waypoint1_idx,
-                        'waypoint2_index': waypoint2_idx,
-                        'severity': 'critical' if distance < self.config.critical_distance else 'warning'
-                    }
-                    
-                    conflicts.append(conflict)
-                    
-                    logger.warning(f"Conflict detected: {drone1}(WP{waypoint1_idx}) vs "
-                                 f"{drone2}(WP{waypoint2_idx}) at {t:.1f}s distance {distance:.2f}m")
+            conflict = {
+                'time': t,
+                'distance': distance,
+                'drone1': drone1,
+                'drone2': drone2,
+                'position1': pos1,
+                'position2': pos2,
+                'waypoint1_index': waypoint1_idx,
+                'waypoint2_index': waypoint2_idx,
+                'severity': 'critical' if distance_sq < self._critical_sq else 'warning'
+            }
+            
+            conflicts.append(conflict)
+            
+            logger.warning(f"Conflict detected: {drone1}(WP{waypoint1_idx}) vs "
+                         f"{drone2}(WP{waypoint2_idx}) at {t:.1f}s distance {distance:.2f}m")
         
         return conflicts
     
+    def _adaptive_sample_times(self, arrays1: TrajectoryArrays, arrays2: TrajectoryArrays, 
+                               max_time: float) -> np.ndarray:
+        """
+        Build sample times whose spacing follows the relative speed of two drones
+        
+        Args:
+            arrays1: First drone trajectory arrays
+            arrays2: Second drone trajectory arrays
+            max_time: End of the sampled time range (exclusive)
+            
+        Returns:
+            Ascending sample times starting at 0s
+        """
+        if max_time <= 0:
+            return np.empty(0)
+        
+        # Both trajectories move linearly between the merged breakpoints
+        breaks = np.union1d(arrays1.t, arrays2.t)
+        breaks = np.concatenate(([0.0], breaks[(breaks > 0) & (breaks < max_time)], [max_time]))
+        seg_len = np.diff(breaks)
+        
+        p1 = np.empty((len(breaks), 3))
+        p2 = np.empty((len(breaks), 3))
+        interp_xyz(arrays1.t, arrays1.xyz, breaks, p1)
+        interp_xyz(arrays2.t, arrays2.xyz, breaks, p2)
+        rel_step = np.diff(p1 - p2, axis=0)
+        rel_speed = np.sqrt(np.einsum('ij,ij->i', rel_step, rel_step)) / seg_len
+        
+        # Relative motion between samples stays within half the safety distance
+        with np.errstate(divide='ignore'):
+            dt = np.clip(0.5 * self._safety / rel_speed, MIN_SAMPLE_INTERVAL, MAX_SAMPLE_INTERVAL)
+        
+        # Samples fall where the cumulative sample count crosses whole numbers
+        counts = np.concatenate(([0.0], np.cumsum(seg_len / dt)))
+        return np.interp(np.arange(0, counts[-1]), counts, breaks)
+    
+    def _get_trajectory_arrays(self, drone_id: str, trajectory: List[Dict]) -> TrajectoryArrays:
+        """
+        Get SoA arrays for a drone trajectory, rebuilding them only when the
+        trajectory list has been replaced or resized
+        
+        Args:
+            drone_id: Drone identifier used as cache key
+            trajectory: Trajectory data for the drone
+            
+        Returns:
+            TrajectoryArrays for the trajectory
+        """
+        key = (id(trajectory), len(trajectory))
+        cached = self._traj_cache.get(drone_id)
+        if cached is None or cached[:2] != key:
+            cached = (*key, to_arrays(trajectory))
+            self._traj_cache[drone_id] = cached
+        return cached[2]
+    
+    def _get_wait_grid(self, drone_id: str, trajectory: List[Dict], 
+                       interval: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the trajectory sampled on a fixed time grid starting at 0s
+        
+        Args:
+            drone_id: Drone identifier used as cache key
+            trajectory: Trajectory data for the drone
+            interval: Grid spacing in seconds
+            
+        Returns:
+            Tuple of (grid times, grid positions with shape (M, 3))
+        """
+        arrays = self._get_trajectory_arrays(drone_id, trajectory)
+        cached = self._wait_grid.get(drone_id)
+        if cached is None or cached[0] is not arrays:
+            t_grid = np.arange(0, arrays.t[-1], interval)
+            xyz_grid = np.empty((len(t_grid), 3))
+            interp_xyz(arrays.t, arrays.xyz, t_grid, xyz_grid)
+            cached = (arrays, t_grid, xyz_grid)
+            self._wait_grid[drone_id] = cached
+        return cached[1], cached[2]
+    
     def _calculate_precise_wait_time(self, traj1: List[Dict], traj2: List[Dict], 
                                    conflict: Dict) -> float:
         """
@@ -149,85 +287,108 @@ class CollisionAvoidanceSystem:
         safety_buffer = 2.0  # Additional safety margin
         check_interval = 0.1
         
-        for t in np.arange(conflict_time, traj1[-1]['time'], check_interval):
-            pos1 = self._interpolate_position(traj1, t)
-            if pos1:
-                distance = self._calculate_distance_3d(pos1, conflict_pos2)
-                
-                if distance > (self.config.safety_distance + safety_buffer):
-                    wait_time = t - conflict_time
-                    logger.info(f"Calculated wait time: {wait_time:.1f}s "
-                               f"(first drone flies out of safety distance)")
-                    return max(wait_time, 3.0)  # Minimum 3 seconds wait
+        t_grid, xyz_grid = self._get_wait_grid(conflict['drone1'], traj1, check_interval)
+        
+        # First grid sample at or after the conflict time
+        start = int(ceil(conflict_time / check_interval - 1e-6))
+        
+        # Squared distances from the priority drone to the waiting drone's conflict position
+        diff = xyz_grid[start:] - (conflict_pos2['x'], conflict_pos2['y'], conflict_pos2['z'])
+        distances_sq = np.einsum('ij,ij->i', diff, diff)
+        
+        exits = np.flatnonzero(distances_sq > (self._safety + safety_buffer) ** 2)
+        if exits.size:
+            wait_time = t_grid[start + exits[0]] - conflict_time
+            logger.info(f"Calculated wait time: {wait_time:.1f}s "
+                       f"(first drone flies out of safety distance)")
+            return max(wait_time, 3.0)  # Minimum 3 seconds wait
         
         # If first drone doesn't fly out of safety distance before completing mission,
         # wait for mission completion
-        completion_wait = traj1[-1]['time'] - conflict_time + 5.0
+        completion_wait = self._get_trajectory_arrays(conflict['drone1'], traj1).t_max - conflict_time + 5.0
         logger.info(f"Using mission completion wait time: {completion_wait:.1f}s")
         return max(completion_wait, 5.0)
     
-    def _interpolate_position(self, trajectory: List[Dict], time: float) -> Optional[Dict]:
+    def _interpolate_position(self, trajectory: List[Dict], time: float,
+                              drone_id: Optional[str] = None) -> Optional[Dict]:
         """
         Interpolate position at specified time in trajectory
         
         Args:
             trajectory: List of trajectory points
             time: Time to interpolate at
+            drone_id: Optional drone identifier to reuse the cached trajectory arrays
             
         Returns:
             Interpolated position dictionary or None
         """
         if not trajectory:
             return None
+        
+        if drone_id is not None:
+            arrays = self._get_trajectory_arrays(drone_id, trajectory)
+        else:
+            arrays = to_arrays(trajectory)
             
-        # Boundary conditions
-        if time >= trajectory[-1]['time']:
-            return trajectory[-1]
-        if time <= trajectory[0]['time']:
-            return trajectory[0]
+        # Boundary conditions (copies, so callers cannot alter the trajectory's records)
+        if time >= arrays.t_max:
+            return dict(arrays.last_point)
+        if time <= arrays.t_min:
+            return dict(arrays.first_point)
+        
+        times, xyz = arrays.t, arrays.xyz
+        
+        # Binary search for the bracketing segment (times[i] <= time < times[i + 1])
+        i = int(np.searchsorted(times, time, side='right')) - 1
         
         # Linear interpolation
-        for i in range(len(trajectory) - 1):
-            t1, t2 = trajectory[i]['time'], trajectory[i + 1]['time']
-            if t1 <= time <= t2:
-                if t2 - t1 == 0:
-                    return trajectory[i]
-                    
-                ratio = (time - t1) / (t2 - t1)
-                return {
-                    'x': trajectory[i]['x'] + ratio * (trajectory[i + 1]['x'] - trajectory[i]['x']),
-                    'y': trajectory[i]['y'] + ratio * (trajectory[i + 1]['y'] - trajectory[i]['y']),
-                    'z': trajectory[i]['z'] + ratio * (trajectory[i + 1]['z'] - trajectory[i]['z']),
-                    'time': time
-                }
-        
-        return None
+        ratio = (time - times[i]) / (times[i + 1] - times[i])
+        x, y, z = (xyz[i] + ratio * (xyz[i + 1] - xyz[i])).tolist()
+        return {
+            'x': x,
+            'y': y,
+            'z': z,
+            'time': time
+        }
     
-    def _find_nearest_waypoint_index(self, trajectory: List[Dict], time: float) -> int:
+    def _find_nearest_waypoint_index(self, arrays: TrajectoryArrays, time: float) -> int:
         """
         Find nearest waypoint index for specified time
         
         Args:
-            trajectory: Trajectory data
+            arrays: Trajectory SoA arrays
             time: Time to find waypoint for
             
         Returns:
             Waypoint index
         """
-        if not trajectory:
-            return 0
+        return int(self._find_nearest_waypoint_indices(arrays, np.array([time]))[0])
+    
+    def _find_nearest_waypoint_indices(self, arrays: TrajectoryArrays, times: np.ndarray) -> np.ndarray:
+        """
+        Find nearest waypoint indices for an array of times
+        
+        Args:
+            arrays: Trajectory SoA arrays
+            times: Times to find waypoints for
             
-        min_diff = float('inf')
-        nearest_idx = 0
+        Returns:
+            Array of waypoint indices, one per time
+        """
+        # Only consider real waypoints, not interpolated points
+        wp_t, wp_i = arrays.wp_t, arrays.wp_i
+        if len(wp_t) == 0:
+            return np.zeros(len(times), dtype=np.int32)
+        if len(wp_t) == 1:
+            return np.full(len(times), wp_i[0], dtype=np.int32)
         
-        for i, point in enumerate(trajectory):
-            if 'waypoint_index' in point:  # Only consider real waypoints, not interpolated points
-                time_diff = abs(point['time'] - time)
-                if time_diff < min_diff:
-                    min_diff = time_diff
-                    nearest_idx = point.get('waypoint_index', i)
+        # Waypoint times are sorted, so the nearest one brackets the search position
+        k = np.clip(np.searchsorted(wp_t, times), 1, len(wp_t) - 1)
+        take_right = np.abs(wp_t[k] - times) < np.abs(wp_t[k - 1] - times)
         
-        return nearest_idx
+        # Ties go to the earliest waypoint with that time
+        nearest = np.where(take_right, k, np.searchsorted(wp_t, wp_t[k - 1]))
+        return wp_i[nearest]
     
     def check_collisions(self, positions: Dict[str, Dict], current_time: float) -> Tuple[List[Dict], Dict[str, float]]:
         """
@@ -240,57 +401,85 @@ class CollisionAvoidanceSystem:
         Returns:
             Tuple of (collision_warnings, new_loiter_commands)
         """
-        self.collision_warnings.clear()
-        new_loiters = {}
-        
-        drone_ids = sorted(positions.keys())
-        
-        for i in range(len(drone_ids)):
-            for j in range(i + 1, len(drone_ids)):
-                drone1, drone2 = drone_ids[i], drone_ids[j]
-                pos1, pos2 = positions[drone1], positions[drone2]
-                
-                if pos1 and pos2:
-                    distance = self._calculate_distance_3d(pos1, pos2)
-                    
-                    if distance < self.config.safety_distance:
-                        warning = {
-                            'drone1': drone1,
-                            'drone2': drone2,
-                            'distance': distance,
-                            'time': current_time,
-                            'position': ((pos1['x'] + pos2['x'])/2, 
-                                       (pos1['y'] + pos2['y'])/2, 
-                                       (pos1['z'] + pos2['z'])/2),
-                            'severity': 'critical' if distance < self.config.critical_distance else 'warning'
-                        }
-                        self.collision_warnings.append(warning)
-                        
-                        # Log real-time collision with position data
-                        collision_data = {
-                            **warning,
-                            'position1': pos1,
-                            'position2': pos2,
-                            'waypoint1_index': pos1.get('waypoint_index', 0),
-                            'waypoint2_index': pos2.get('waypoint_index', 0)
-                        }
-                        self.collision_logger.log_collision(collision_data)
-        
-        return self.collision_warnings, new_loiters
+        # Drones without a position never take part in a pair
+        drone_ids = sorted(drone_id for drone_id, pos in positions.items() if pos)
+        P = np.array([[positions[drone_id][k] for k in 'xyz'] for drone_id in drone_ids],
+                     dtype=np.float64).reshape(-1, 3)
+        return self.check_collisions_array(drone_ids, P, positions, current_time)
     
-    def _calculate_distance_3d(self, pos1: Dict, pos2: Dict) -> float:
+    def check_collisions_array(self, drone_ids: List[str], P: np.ndarray, positions: Dict[str, Dict],
+                               current_time: float) -> Tuple[List[Dict], Dict[str, float]]:
         """
-        Calculate 3D distance between two positions
+        Check collisions at current time from a prebuilt positions array
         
         Args:
-            pos1, pos2: Position dictionaries with x, y, z coordinates
+            drone_ids: Sorted identifiers of the drones with a position
+            P: Positions of those drones in the same order, shape (N, 3)
+            positions: Current position dictionaries, used for logging
+            current_time: Current simulation time
             
         Returns:
-            3D distance in meters
+            Tuple of (collision_warnings, new_loiter_commands)
         """
-        return math.sqrt((pos1['x'] - pos2['x'])**2 + 
-                        (pos1['y'] - pos2['y'])**2 + 
-                        (pos1['z'] - pos2['z'])**2)
+        self.collision_warnings.clear()
+        new_loiters = {}
+        
+        if len(drone_ids) < 2:
+            return self.collision_warnings, new_loiters
+        
+        # Distances and the re-arm filter in one kernel pass over all pairs
+        n_pairs = len(drone_ids) * (len(drone_ids) - 1) // 2
+        if self._pair_d2.size < n_pairs:
+            self._pair_i = np.empty(n_pairs, dtype=np.int64)
+            self._pair_j = np.empty(n_pairs, dtype=np.int64)
+            self._pair_d2 = np.empty(n_pairs)
+        count = near_pairs(np.ascontiguousarray(P), self._rearm_sq,
+                           self._pair_i, self._pair_j, self._pair_d2)
+        iu, ju, pair_d2 = self._pair_i[:count], self._pair_j[:count], self._pair_d2[:count]
+        
+        # Separated pairs get logged again as soon as they re-enter the safety distance
+        if self._last_logged:
+            near = {(drone_ids[iu[k]], drone_ids[ju[k]])
+                    for k in np.flatnonzero(pair_d2 <= self._rearm_sq)}
+            for pair in [pair for pair in self._last_logged if pair not in near]:
+                del self._last_logged[pair]
+        
+        # Only build warnings for pairs inside the safety distance
+        for hit in np.flatnonzero(pair_d2 < self._safety_sq):
+            i, j = iu[hit], ju[hit]
+            drone1, drone2 = drone_ids[i], drone_ids[j]
+            pos1, pos2 = positions[drone1], positions[drone2]
+            distance_sq = float(pair_d2[hit])
+            mid_x, mid_y, mid_z = ((P[i] + P[j]) * 0.5).tolist()
+            
+            warning = {
+                'drone1': drone1,
+                'drone2': drone2,
+                'distance': sqrt(distance_sq),
+                'time': current_time,
+                'position': (mid_x, mid_y, mid_z),
+                'severity': 'critical' if distance_sq < self._critical_sq else 'warning'
+            }
+            self.collision_warnings.append(warning)
+            
+            # Log at most once per check interval for a sustained conflict
+            # (a negative elapsed time means the simulation was rewound)
+            elapsed = current_time - self._last_logged.get((drone1, drone2), -inf)
+            if 0.0 <= elapsed < self._log_interval:
+                continue
+            self._last_logged[(drone1, drone2)] = current_time
+            
+            # Log real-time collision with position data
+            collision_data = {
+                **warning,
+                'position1': pos1,
+                'position2': pos2,
+                'waypoint1_index': pos1.get('waypoint_index', 0),
+                'waypoint2_index': pos2.get('waypoint_index', 0)
+            }
+            self.collision_logger.log_collision(collision_data)
+        
+        return self.collision_warnings, new_loiters
     
     def update_safety_config(self, new_config: SafetyConfig) -> None:
         """
@@ -299,8 +488,9 @@ class CollisionAvoidanceSystem:
         Args:
             new_config: New safety configuration
         """
-        old_distance = self.config.safety_distance
+        old_distance = self._safety
         self.config = new_config
+        self._cache_thresholds(new_config)
         
         logger.info(f"Safety configuration updated: distance {old_distance}m → {new_config.safety_distance}m")
     
@@ -333,6 +523,7 @@ class CollisionAvoidanceSystem:
         """
         count = len(self.collision_warnings)
         self.collision_warnings.clear()
+        self._last_logged.clear()
         logger.info(f"Cleared {count} collision warnings")
         return count
     
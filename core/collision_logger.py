@@ -5,14 +5,98 @@ Collision Logger Module - New feature for v5.1
 Professional collision event documentation and analysis
 """
 
+import atexit
 import json
 import logging
+import os
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import BinaryIO, Callable, Deque, Dict, List, Optional, Tuple
 from config.settings import CollisionLogConfig, SimulatorConfig
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug("orjson not available, using json for collision log export")
+
+# Write buffer for exported logs; events are streamed through it row by row
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+class _WriteBackQueue:
+    """
+    Write-back queue for export files
+    
+    Callers enqueue a path and a function streaming the file contents; a daemon
+    thread runs the writers in order so the caller never waits on disk. Each file is
+    written next to its path and moved into place once complete, so a write cut short
+    at interpreter exit, where queued writes get a bounded time to finish, leaves no partial file.
+    """
+    
+    def __init__(self, exit_timeout: float):
+        self._exit_timeout = exit_timeout
+        self._pending: Deque[Tuple[str, Callable[[BinaryIO], None]]] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def enqueue(self, path: str, write: Callable[[BinaryIO], None]) -> None:
+        """Queue a file write, starting the writer thread on first use"""
+        with self._condition:
+            self._pending.append((path, write))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, name="collision-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self._flush_at_exit)
+            self._condition.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write has finished
+        
+        Returns:
+            True if the queue drained within the timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+    
+    def _flush_at_exit(self) -> None:
+        """Give queued writes their time to finish, warning about any left unwritten"""
+        if not self.flush(self._exit_timeout):
+            with self._condition:
+                unfinished = len(self._pending) + self._busy
+            logger.warning(f"{unfinished} collision log export(s) did not finish within "
+                           f"{self._exit_timeout}s of exit and were not saved")
+    
+    def _drain(self) -> None:
+        """Writer thread body"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                path, write = self._pending.popleft()
+                self._busy = True
+            
+            temp_path = path + '.tmp'
+            try:
+                with open(temp_path, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+                    write(f)
+                os.replace(temp_path, path)
+                logger.info(f"Collision log exported successfully: {path}")
+            except Exception as e:
+                logger.error(f"Failed to export collision log to {path}: {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
 class CollisionLogger:
     """
     Professional collision event logger with JSON export capability
@@ -23,6 +107,10 @@ class CollisionLogger:
         self.collision_events: List[Dict] = []
         self.log_file: Optional[str] = None
         self.config = CollisionLogConfig()
+        self._write_back = _WriteBackQueue(self.config.EXIT_FLUSH_TIMEOUT)
+        
+        # Compact JSON of each event, filled in on export; events are only ever appended
+        self._event_rows: List[bytes] = []
         
     def initialize_log_file(self, base_name: str = None) -> str:
         """
@@ -51,18 +139,7 @@ class CollisionLogger:
         Args:
             collision_data: Dictionary containing collision information
         """
-        event = {
-            'timestamp': datetime.now().isoformat(),
-            'simulation_time': collision_data.get('time', 0),
-            'drone1': collision_data.get('drone1'),
-            'drone2': collision_data.get('drone2'),
-            'distance': collision_data.get('distance'),
-            'severity': collision_data.get('severity'),
-            'position1': collision_data.get('position1'),
-            'position2': collision_data.get('position2'),
-            'waypoint1_index': collision_data.get('waypoint1_index'),
-            'waypoint2_index': collision_data.get('waypoint2_index')
-        }
+        event = self._make_event(collision_data, datetime.now().isoformat())
         
         self.collision_events.append(event)
         
@@ -73,6 +150,50 @@ class CollisionLogger:
         else:
             logger.warning(f"Collision warning: {event['drone1']} vs {event['drone2']} "
                           f"at {event['distance']:.2f}m (sim time: {event['simulation_time']:.1f}s)")
+    
+    def log_collisions_bulk(self, collisions: List[Dict]) -> None:
+        """
+        Log a batch of collision events, e.g. all conflicts of one trajectory analysis
+        
+        Args:
+            collisions: List of dictionaries containing collision information
+        """
+        if not collisions:
+            return
+        
+        timestamp = datetime.now().isoformat()
+        events = [self._make_event(collision_data, timestamp) for collision_data in collisions]
+        self.collision_events.extend(events)
+        
+        # One summary line instead of one console line per event
+        critical_count = sum(1 for event in events if event['severity'] == 'critical')
+        level = logging.ERROR if critical_count else logging.WARNING
+        logger.log(level, f"Logged {len(events)} collision events "
+                          f"({critical_count} critical, {len(events) - critical_count} warning)")
+    
+    def _make_event(self, collision_data: Dict, timestamp: str) -> Dict:
+        """
+        Build a collision event record
+        
+        Args:
+            collision_data: Dictionary containing collision information
+            timestamp: ISO timestamp of the event
+            
+        Returns:
+            Collision event dictionary
+        """
+        return {
+            'timestamp': timestamp,
+            'simulation_time': collision_data.get('time', 0),
+            'drone1': collision_data.get('drone1'),
+            'drone2': collision_data.get('drone2'),
+            'distance': collision_data.get('distance'),
+            'severity': collision_data.get('severity'),
+            'position1': collision_data.get('position1'),
+            'position2': collision_data.get('position2'),
+            'waypoint1_index': collision_data.get('waypoint1_index'),
+            'waypoint2_index': collision_data.get('waypoint2_index')
+        }
         
     def get_collision_statistics(self) -> Dict:
         """
@@ -129,15 +250,21 @@ class CollisionLogger:
         """
         count = len(self.collision_events)
         self.collision_events.clear()
+        self._event_rows.clear()
         logger.info(f"Cleared {count} collision events")
         return count
     
-    def export_collision_log(self, export_path: str = None) -> Optional[str]:
+    def export_collision_log(self, export_path: str = None, background: bool = False) -> Optional[str]:
         """
         Export collision log to JSON file with statistics
         
+        Paths ending in the NDJSON extension get one record per line instead: the
+        metadata first, then each event.
+        
         Args:
             export_path: Custom export path (optional)
+            background: Queue the write on the write-back thread and return at once;
+                failures are then only logged (see flush_exports)
             
         Returns:
             Path to exported file, or None if failed
@@ -158,39 +285,127 @@ class CollisionLogger:
             # Generate statistics
             statistics = self.get_collision_statistics()
             
-            # Prepare export data
-            export_data = {
-                'metadata': {
-                    'total_events': len(self.collision_events),
-                    'export_time': datetime.now().isoformat(),
-                    'simulation_version': SimulatorConfig.VERSION,
-                    'simulation_edition': SimulatorConfig.EDITION,
-                    'statistics': statistics
-                },
-                'collision_events': self.collision_events
+            metadata = {
+                'total_events': len(self.collision_events),
+                'export_time': datetime.now().isoformat(),
+                'simulation_version': SimulatorConfig.VERSION,
+                'simulation_edition': SimulatorConfig.EDITION,
+                'statistics': statistics
             }
             
-            # Write to file
-            with open(export_path, 'w', encoding=self.config.ENSURE_ASCII) as f:
-                json.dump(export_data, f, 
-                         indent=self.config.INDENT,
-                         ensure_ascii=self.config.ENSURE_ASCII)
+            # Snapshot of the serialized rows, so events logged meanwhile are not included
+            rows = self._serialize_events()
+            
+            if export_path.lower().endswith(self.config.NDJSON_EXTENSION):
+                def write(f: BinaryIO) -> None:
+                    self._write_export_ndjson(f, metadata, rows)
+            else:
+                def write(f: BinaryIO) -> None:
+                    self._write_export(f, metadata, rows)
             
-            logger.info(f"Collision log exported successfully: {export_path}")
             logger.info(f"Export summary: {statistics['total_events']} events, "
                        f"{statistics['critical_events']} critical, "
                        f"{statistics['warning_events']} warnings")
             
+            if background:
+                self._write_back.enqueue(export_path, write)
+                return export_path
+            
+            # Write to file
+            with open(export_path, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+                write(f)
+            
+            logger.info(f"Collision log exported successfully: {export_path}")
+            
             return export_path
             
         except Exception as e:
             logger.error(f"Failed to export collision log: {e}")
             return None
     
+    def _serialize_events(self) -> List[bytes]:
+        """
+        Serialize events not yet serialized by an earlier export
+        
+        Returns:
+            Compact JSON rows of all current events, in order
+        """
+        rows = self._event_rows
+        if len(rows) > len(self.collision_events):
+            rows.clear()
+        rows.extend(map(self._dumps_compact, self.collision_events[len(rows):]))
+        return rows[:]
+    
+    def _dumps_compact(self, obj: Dict) -> bytes:
+        """
+        Serialize to compact JSON bytes, with orjson when it is installed
+        
+        Args:
+            obj: JSON-compatible object
+            
+        Returns:
+            Encoded JSON
+        """
+        # orjson always writes UTF-8 and never escapes non-ASCII characters
+        if ORJSON_AVAILABLE and not self.config.ENSURE_ASCII:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+            except orjson.JSONEncodeError:
+                pass  # e.g. non-string keys, which json converts
+        return json.dumps(obj, separators=(',', ':'),
+                          ensure_ascii=self.config.ENSURE_ASCII).encode(SimulatorConfig.EXPORT_ENCODING)
+    
+    def _write_export(self, f: BinaryIO, metadata: Dict, rows: List[bytes]) -> None:
+        """
+        Stream an export document: indented metadata, then one pre-serialized event per line
+        
+        Args:
+            f: Binary file to write to
+            metadata: Export metadata
+            rows: Serialized collision events
+        """
+        encoding = SimulatorConfig.EXPORT_ENCODING
+        metadata_json = json.dumps(metadata, indent=self.config.INDENT, ensure_ascii=self.config.ENSURE_ASCII)
+        
+        f.write(b'{\n  "metadata": ')
+        f.write(metadata_json.replace('\n', '\n  ').encode(encoding))
+        f.write(b',\n  "collision_events": [\n    ')
+        f.write(b',\n    '.join(rows))
+        f.write(b'\n  ]\n}\n')
+    
+    def _write_export_ndjson(self, f: BinaryIO, metadata: Dict, rows: List[bytes]) -> None:
+        """
+        Stream an NDJSON export: a metadata record, then one event per line
+        
+        Args:
+            f: Binary file to write to
+            metadata: Export metadata
+            rows: Serialized collision events
+        """
+        f.write(self._dumps_compact({'metadata': metadata}))
+        f.write(b'\n')
+        for row in rows:
+            f.write(row)
+            f.write(b'\n')
+    
+    def flush_exports(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background exports to reach the disk
+        
+        Args:
+            timeout: Maximum seconds to wait (optional)
+            
+        Returns:
+            True if all queued exports finished
+        """
+        return self._write_back.flush(timeout)
+    
     def import_collision_log(self, import_path: str) -> bool:
         """
         Import collision log from JSON file
         
+        NDJSON exports (see export_collision_log) are recognized by their extension.
+        
         Args:
             import_path: Path to import file
             
@@ -198,8 +413,14 @@ class CollisionLogger:
             True if successful, False otherwise
         """
         try:
-            with open(import_path, 'r', encoding=self.config.ENSURE_ASCII) as f:
-                data = json.load(f)
+            with open(import_path, 'r', encoding=SimulatorConfig.EXPORT_ENCODING) as f:
+                if import_path.lower().endswith(self.config.NDJSON_EXTENSION):
+                    records = [json.loads(line) for line in f if line.strip()]
+                    data = {'collision_events': records}
+                    if records and 'metadata' in records[0]:
+                        data['metadata'] = records.pop(0)['metadata']
+                else:
+                    data = json.load(f)
             
             # Validate data structure
             if 'collision_events' not in data:
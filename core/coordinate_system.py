@@ -5,10 +5,13 @@ Earth Coordinate System Module
 Handles lat/lon to meter coordinate conversions with Earth curvature correction
 """
 
-import math
+from math import sqrt, sin, cos, asin, atan2
 import logging
+import numpy as np
 from typing import Tuple, Optional
-from config.settings import EARTH_RADIUS_KM, METERS_PER_DEGREE_LAT
+from config.settings import (
+    EARTH_RADIUS_M, METERS_PER_DEGREE_LAT, INV_METERS_PER_DEGREE_LAT, DEG2RAD, RAD2DEG
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,7 @@ class EarthCoordinateSystem:
         self.origin_lat: Optional[float] = None
         self.origin_lon: Optional[float] = None
         self._meters_per_degree_lon: Optional[float] = None
+        self._inv_mpd_lon: Optional[float] = None
         
     def set_origin(self, lat: float, lon: float) -> None:
         """
@@ -31,11 +35,13 @@ class EarthCoordinateSystem:
             lat: Latitude of origin point
             lon: Longitude of origin point
         """
-        self.origin_lat = lat
-        self.origin_lon = lon
+        # Plain floats keep the per-waypoint conversions on fast scalar arithmetic
+        self.origin_lat = float(lat)
+        self.origin_lon = float(lon)
         
         # Pre-calculate longitude conversion factor at this latitude
-        self._meters_per_degree_lon = METERS_PER_DEGREE_LAT * math.cos(math.radians(lat))
+        self._meters_per_degree_lon = METERS_PER_DEGREE_LAT * cos(self.origin_lat * DEG2RAD)
+        self._inv_mpd_lon = 1.0 / self._meters_per_degree_lon
         
         logger.info(f"Coordinate origin set to: {lat:.8f}, {lon:.8f}")
         logger.info(f"Longitude conversion factor: {self._meters_per_degree_lon:.2f} m/degree")
@@ -45,12 +51,15 @@ class EarthCoordinateSystem:
         Convert lat/lon to meter coordinates with Earth curvature correction
         
         Args:
-            lat: Latitude in decimal degrees
-            lon: Longitude in decimal degrees
+            lat: Latitude in decimal degrees (arrays are converted in one batch)
+            lon: Longitude in decimal degrees (arrays are converted in one batch)
             
         Returns:
             Tuple of (x, y) coordinates in meters (East, North)
         """
+        if isinstance(lat, np.ndarray) or isinstance(lon, np.ndarray):
+            return self.lat_lon_to_meters_batch(lat, lon)
+        
         if self.origin_lat is None or self.origin_lon is None:
             logger.warning("Coordinate origin not set, returning (0, 0)")
             return 0.0, 0.0
@@ -63,6 +72,29 @@ class EarthCoordinateSystem:
         
         return x, y
     
+    def lat_lon_to_meters_batch(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert arrays of lat/lon to meter coordinates
+        
+        Args:
+            lat: Latitudes in decimal degrees
+            lon: Longitudes in decimal degrees
+            
+        Returns:
+            Tuple of (x, y) coordinate arrays in meters (East, North)
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        
+        if self.origin_lat is None or self.origin_lon is None:
+            logger.warning("Coordinate origin not set, returning zeros")
+            return np.zeros_like(lon), np.zeros_like(lat)
+        
+        y = (lat - self.origin_lat) * METERS_PER_DEGREE_LAT
+        x = (lon - self.origin_lon) * self._meters_per_degree_lon
+        
+        return x, y
+    
     def meters_to_lat_lon(self, x: float, y: float) -> Tuple[float, float]:
         """
         Convert meter coordinates to lat/lon
@@ -79,10 +111,33 @@ class EarthCoordinateSystem:
             return 0.0, 0.0
             
         # Latitude conversion
-        lat = self.origin_lat + y / METERS_PER_DEGREE_LAT
+        lat = self.origin_lat + y * INV_METERS_PER_DEGREE_LAT
         
         # Longitude conversion
-        lon = self.origin_lon + x / self._meters_per_degree_lon
+        lon = self.origin_lon + x * self._inv_mpd_lon
+        
+        return lat, lon
+    
+    def meters_to_lat_lon_batch(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert arrays of meter coordinates to lat/lon
+        
+        Args:
+            x: East distances in meters
+            y: North distances in meters
+            
+        Returns:
+            Tuple of (lat, lon) arrays in decimal degrees
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        
+        if self.origin_lat is None or self.origin_lon is None:
+            logger.warning("Coordinate origin not set, returning zeros")
+            return np.zeros_like(y), np.zeros_like(x)
+        
+        lat = self.origin_lat + y * INV_METERS_PER_DEGREE_LAT
+        lon = self.origin_lon + x * self._inv_mpd_lon
         
         return lat, lon
     
@@ -99,22 +154,22 @@ class EarthCoordinateSystem:
             Distance in meters
         """
         # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
+        lat1_rad = lat1 * DEG2RAD
+        lon1_rad = lon1 * DEG2RAD
+        lat2_rad = lat2 * DEG2RAD
+        lon2_rad = lon2 * DEG2RAD
         
         # Haversine formula
         dlat = lat2_rad - lat1_rad
         dlon = lon2_rad - lon1_rad
         
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2)
+        a = (sin(dlat/2)**2 + 
+             cos(lat1_rad) * cos(lat2_rad) * sin(dlon/2)**2)
         
-        c = 2 * math.asin(math.sqrt(a))
+        c = 2 * asin(sqrt(a))
         
         # Distance in meters
-        distance = EARTH_RADIUS_KM * 1000 * c
+        distance = EARTH_RADIUS_M * c
         
         return distance
     
@@ -131,25 +186,72 @@ class EarthCoordinateSystem:
             Bearing in degrees (0-360, where 0 is North)
         """
         # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
+        lat1_rad = lat1 * DEG2RAD
+        lon1_rad = lon1 * DEG2RAD
+        lat2_rad = lat2 * DEG2RAD
+        lon2_rad = lon2 * DEG2RAD
         
         dlon = lon2_rad - lon1_rad
         
-        y = math.sin(dlon) * math.cos(lat2_rad)
-        x = (math.cos(lat1_rad) * math.sin(lat2_rad) - 
-             math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon))
+        y = sin(dlon) * cos(lat2_rad)
+        x = (cos(lat1_rad) * sin(lat2_rad) - 
+             sin(lat1_rad) * cos(lat2_rad) * cos(dlon))
         
-        bearing_rad = math.atan2(y, x)
-        bearing_deg = math.degrees(bearing_rad)
+        bearing_rad = atan2(y, x)
+        bearing_deg = bearing_rad * RAD2DEG
         
         # Normalize to 0-360 degrees
         bearing_normalized = (bearing_deg + 360) % 360
         
         return bearing_normalized
     
+    def calculate_distance_batch(self, lat1: np.ndarray, lon1: np.ndarray, 
+                                 lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+        """
+        Calculate Haversine distances between arrays of lat/lon points
+        
+        Args:
+            lat1, lon1: First point coordinates (arrays or scalars, broadcast together)
+            lat2, lon2: Second point coordinates (arrays or scalars, broadcast together)
+            
+        Returns:
+            Array of distances in meters
+        """
+        lat1_rad = np.radians(lat1)
+        lon1_rad = np.radians(lon1)
+        lat2_rad = np.radians(lat2)
+        lon2_rad = np.radians(lon2)
+        
+        # Haversine formula
+        sin_dlat = np.sin((lat2_rad - lat1_rad) / 2)
+        sin_dlon = np.sin((lon2_rad - lon1_rad) / 2)
+        
+        a = sin_dlat * sin_dlat + np.cos(lat1_rad) * np.cos(lat2_rad) * sin_dlon * sin_dlon
+        
+        return EARTH_RADIUS_M * 2 * np.arcsin(np.sqrt(a))
+    
+    def calculate_bearing_batch(self, lat1: np.ndarray, lon1: np.ndarray, 
+                                lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+        """
+        Calculate bearings between arrays of lat/lon points
+        
+        Args:
+            lat1, lon1: Starting point coordinates (arrays or scalars, broadcast together)
+            lat2, lon2: Ending point coordinates (arrays or scalars, broadcast together)
+            
+        Returns:
+            Array of bearings in degrees (0-360, where 0 is North)
+        """
+        lat1_rad = np.radians(lat1)
+        lat2_rad = np.radians(lat2)
+        dlon = np.radians(lon2) - np.radians(lon1)
+        
+        cos_lat2 = np.cos(lat2_rad)
+        y = np.sin(dlon) * cos_lat2
+        x = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * cos_lat2 * np.cos(dlon)
+        
+        return (np.degrees(np.arctan2(y, x)) + 360) % 360
+    
     def get_point_at_distance_bearing(self, lat: float, lon: float, 
                                      distance: float, bearing: float) -> Tuple[float, float]:
         """
@@ -164,27 +266,27 @@ class EarthCoordinateSystem:
             Tuple of (lat, lon) for the destination point
         """
         # Convert to radians
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        bearing_rad = math.radians(bearing)
+        lat_rad = lat * DEG2RAD
+        lon_rad = lon * DEG2RAD
+        bearing_rad = bearing * DEG2RAD
         
         # Angular distance
-        angular_distance = distance / (EARTH_RADIUS_KM * 1000)
+        angular_distance = distance / EARTH_RADIUS_M
         
         # Calculate destination point
-        lat2_rad = math.asin(
-            math.sin(lat_rad) * math.cos(angular_distance) +
-            math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
+        lat2_rad = asin(
+            sin(lat_rad) * cos(angular_distance) +
+            cos(lat_rad) * sin(angular_distance) * cos(bearing_rad)
         )
         
-        lon2_rad = lon_rad + math.atan2(
-            math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-            math.cos(angular_distance) - math.sin(lat_rad) * math.sin(lat2_rad)
+        lon2_rad = lon_rad + atan2(
+            sin(bearing_rad) * sin(angular_distance) * cos(lat_rad),
+            cos(angular_distance) - sin(lat_rad) * sin(lat2_rad)
         )
         
         # Convert back to degrees
-        lat2 = math.degrees(lat2_rad)
-        lon2 = math.degrees(lon2_rad)
+        lat2 = lat2_rad * RAD2DEG
+        lon2 = lon2_rad * RAD2DEG
         
         return lat2, lon2
     
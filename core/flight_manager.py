@@ -6,12 +6,22 @@ Includes takeoff manager and QGC waypoint generator for v5.1
 """
 
 import logging
+import numpy as np
 from typing import List, Dict, Tuple, Optional
-from config.settings import TakeoffConfig
+from config.settings import TakeoffConfig, METERS_PER_DEGREE_LAT
 from core.coordinate_system import EarthCoordinateSystem
+from core.trajectory import waypoints_to_array
 
 logger = logging.getLogger(__name__)
 
+# QGC WPL 110 command line templates, filled with printf-style formatting
+_HOME_LINE = "%d\t1\t0\t179\t0\t0\t0\t0\t%.8f\t%.8f\t%.2f\t1"
+_WAYPOINT_LINE = "%d\t0\t3\t16\t0\t0\t0\t0\t%.8f\t%.8f\t%.2f\t1"
+_TAKEOFF_LINE = "%d\t0\t3\t22\t0\t0\t0\t0\t%.8f\t%.8f\t10.0\t1"
+_SPEED_LINE = "%d\t0\t3\t178\t0\t8.0\t0\t0\t0\t0\t0\t1"
+_LOITER_LINE = "%d\t0\t3\t19\t%.1f\t0\t0\t0\t0\t0\t0\t1"
+_RTL_LINE = "%d\t0\t3\t20\t0\t0\t0\t0\t0\t0\t0\t1"
+
 class TakeoffManager:
     """
     Takeoff manager with improved 2x2 formation
@@ -146,24 +156,14 @@ class QGCWaypointGenerator:
             logger.error(f"No waypoints provided for {drone_id}")
             return lines
         
-        # HOME point
+        # HOME point, speed setting (8 m/s), takeoff and hover wait
         home_wp = waypoints[0]
-        lines.append(f"{self.sequence_counter}\t1\t0\t179\t0\t0\t0\t0\t"
-                    f"{home_wp['lat']:.8f}\t{home_wp['lon']:.8f}\t{home_wp['alt']:.2f}\t1")
-        self.sequence_counter += 1
-        
-        # Speed setting (8 m/s)
-        lines.append(f"{self.sequence_counter}\t0\t3\t178\t0\t8.0\t0\t0\t0\t0\t0\t1")
-        self.sequence_counter += 1
-        
-        # Takeoff
-        lines.append(f"{self.sequence_counter}\t0\t3\t22\t0\t0\t0\t0\t"
-                    f"{home_wp['lat']:.8f}\t{home_wp['lon']:.8f}\t10.0\t1")
-        self.sequence_counter += 1
-        
-        # Hover wait
-        lines.append(f"{self.sequence_counter}\t0\t3\t19\t2.0\t0\t0\t0\t0\t0\t0\t1")
-        self.sequence_counter += 1
+        home_lat, home_lon = home_wp['lat'], home_wp['lon']
+        lines.append(_HOME_LINE % (0, home_lat, home_lon, home_wp['alt']))
+        lines.append(_SPEED_LINE % 1)
+        lines.append(_TAKEOFF_LINE % (2, home_lat, home_lon))
+        lines.append(_LOITER_LINE % (3, 2.0))
+        self.sequence_counter = 4
         
         # Process mission waypoints and insert LOITER if needed
         loiter_waypoint_index = None
@@ -178,19 +178,18 @@ class QGCWaypointGenerator:
         # Mission waypoints (starting from waypoints[1:] since waypoints[0] is HOME)
         for wp_idx, wp in enumerate(waypoints[1:], start=2):  # Waypoint numbering starts from 2
             # Add waypoint
-            lines.append(f"{self.sequence_counter}\t0\t3\t16\t0\t0\t0\t0\t"
-                        f"{wp['lat']:.8f}\t{wp['lon']:.8f}\t{wp['alt']:.2f}\t1")
+            lines.append(_WAYPOINT_LINE % (self.sequence_counter, wp['lat'], wp['lon'], wp['alt']))
             self.sequence_counter += 1
             
             # Check if LOITER should be inserted after this waypoint
             if loiter_waypoint_index == wp_idx and loiter_time > 0:
-                lines.append(f"{self.sequence_counter}\t0\t3\t19\t{loiter_time:.1f}\t0\t0\t0\t0\t0\t0\t1")
+                lines.append(_LOITER_LINE % (self.sequence_counter, loiter_time))
                 self.sequence_counter += 1
                 logger.info(f"{drone_id}: Inserted {loiter_time:.1f}s LOITER after waypoint {wp_idx} "
                            f"(sequence {self.sequence_counter-1})")
         
         # RTL (Return to Launch)
-        lines.append(f"{self.sequence_counter}\t0\t3\t20\t0\t0\t0\t0\t0\t0\t0\t1")
+        lines.append(_RTL_LINE % self.sequence_counter)
         
         logger.info(f"Generated complete mission for {drone_id}: {len(lines)} commands")
         
@@ -248,16 +247,14 @@ class QGCWaypointGenerator:
         for i, wp in enumerate(waypoints):
             if i == 0:
                 # HOME point
-                lines.append(f"{sequence}\t1\t0\t179\t0\t0\t0\t0\t"
-                            f"{wp['lat']:.8f}\t{wp['lon']:.8f}\t{wp['alt']:.2f}\t1")
+                lines.append(_HOME_LINE % (sequence, wp['lat'], wp['lon'], wp['alt']))
             else:
                 # Mission waypoint
-                lines.append(f"{sequence}\t0\t3\t16\t0\t0\t0\t0\t"
-                            f"{wp['lat']:.8f}\t{wp['lon']:.8f}\t{wp['alt']:.2f}\t1")
+                lines.append(_WAYPOINT_LINE % (sequence, wp['lat'], wp['lon'], wp['alt']))
             sequence += 1
         
         # RTL
-        lines.append(f"{sequence}\t0\t3\t20\t0\t0\t0\t0\t0\t0\t0\t1")
+        lines.append(_RTL_LINE % sequence)
         
         logger.info(f"Generated basic mission for {drone_id}: {len(lines)} commands")
         
@@ -357,21 +354,14 @@ class QGCWaypointGenerator:
         # Takeoff and hover time
         total_time += 7.0  # 2s taxi + 5s takeoff + 2s hover (from config)
         
+        # Approximate leg distances in meters, all legs at once
+        wps = waypoints_to_array(waypoints)
+        deltas = np.column_stack([np.diff(wps['lat']) * METERS_PER_DEGREE_LAT,
+                                  np.diff(wps['lon']) * METERS_PER_DEGREE_LAT,
+                                  np.diff(wps['alt'])])
+        
         # Mission waypoint time
-        for i in range(1, len(waypoints)):
-            prev_wp = waypoints[i-1]
-            curr_wp = waypoints[i]
-            
-            # Simple 2D distance calculation for estimation
-            lat_diff = curr_wp['lat'] - prev_wp['lat']
-            lon_diff = curr_wp['lon'] - prev_wp['lon']
-            alt_diff = curr_wp['alt'] - prev_wp['alt']
-            
-            # Approximate distance in meters
-            distance = ((lat_diff * 111111)**2 + (lon_diff * 111111)**2 + alt_diff**2)**0.5
-            
-            # Flight time
-            total_time += distance / cruise_speed
+        total_time += float(np.linalg.norm(deltas, axis=1).sum()) / cruise_speed
         
         logger.debug(f"Estimated mission time: {total_time:.1f}s for {len(waypoints)} waypoints")
         
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trajectory Arrays Module
+Structure-of-arrays trajectory representation for vectorized computations
+"""
+
+import logging
+import numpy as np
+from typing import Dict, List, Optional, Union
+from config.settings import FlightPhase, TakeoffConfig, WAYPOINT_DTYPE
+from core.coordinate_system import EarthCoordinateSystem
+
+logger = logging.getLogger(__name__)
+
+class TrajectoryArrays:
+    """
+    Structure-of-arrays (SoA) view of a trajectory
+    Stores times, positions, flight phases and waypoint indices as contiguous NumPy arrays,
+    plus a compact time table of the real waypoints for nearest-waypoint lookups
+    """
+    
+    __slots__ = ('t', 'xyz', 'wp_idx', 'phase', 'wp_t', 'wp_i', 't_min', 't_max', 
+                 'first_point', 'last_point')
+    
+    def __init__(self, t: np.ndarray, xyz: np.ndarray, wp_idx: np.ndarray,
+                 first_point: Optional[Dict] = None, last_point: Optional[Dict] = None,
+                 phase: Optional[np.ndarray] = None):
+        """
+        Args:
+            t: Point times, shape (N,)
+            xyz: Point positions in meters, shape (N, 3)
+            wp_idx: Waypoint index of each point (-1 for points without one), shape (N,)
+            first_point: Original first trajectory point, returned for times before the start
+            last_point: Original last trajectory point, returned for times after the end
+            phase: FlightPhase value of each point, shape (N,) (defaults to AUTO)
+        """
+        self.t = t
+        self.xyz = xyz
+        self.wp_idx = wp_idx
+        self.phase = phase if phase is not None else np.full(len(t), FlightPhase.AUTO, dtype=np.int8)
+        
+        # Time span as plain floats for boundary checks
+        self.t_min = float(t[0]) if len(t) else 0.0
+        self.t_max = float(t[-1]) if len(t) else 0.0
+        self.first_point = first_point
+        self.last_point = last_point
+        
+        # Times and indices of the points that carry a waypoint index
+        has_waypoint = wp_idx >= 0
+        self.wp_t = t[has_waypoint]
+        self.wp_i = wp_idx[has_waypoint]
+    
+    @property
+    def x(self) -> np.ndarray:
+        """East positions (view into xyz)"""
+        return self.xyz[:, 0]
+    
+    @property
+    def y(self) -> np.ndarray:
+        """North positions (view into xyz)"""
+        return self.xyz[:, 1]
+    
+    @property
+    def z(self) -> np.ndarray:
+        """Altitudes (view into xyz)"""
+        return self.xyz[:, 2]
+    
+    def __len__(self) -> int:
+        """Return number of trajectory points"""
+        return len(self.t)
+    
+    def __str__(self) -> str:
+        """String representation of trajectory arrays"""
+        if not len(self.t):
+            return "TrajectoryArrays(empty)"
+        return f"TrajectoryArrays({len(self.t)} points, {self.t[0]:.1f}s - {self.t[-1]:.1f}s)"
+
+
+def to_arrays(trajectory: Union[List[Dict], TrajectoryArrays]) -> TrajectoryArrays:
+    """
+    Convert a list of trajectory point dictionaries to SoA arrays
+    
+    Args:
+        trajectory: List of trajectory points with time, x, y, z keys
+                    (TrajectoryArrays are returned unchanged)
+        
+    Returns:
+        TrajectoryArrays for the trajectory
+    """
+    if isinstance(trajectory, TrajectoryArrays):
+        return trajectory
+    
+    count = len(trajectory)
+    
+    t = np.fromiter((p['time'] for p in trajectory), dtype=np.float64, count=count)
+    xyz = np.array([(p['x'], p['y'], p['z']) for p in trajectory], dtype=np.float64).reshape(count, 3)
+    wp_idx = np.fromiter((p.get('waypoint_index', -1) for p in trajectory), dtype=np.int32, count=count)
+    phase = np.fromiter((p.get('phase', FlightPhase.AUTO) for p in trajectory), dtype=np.int8, count=count)
+    
+    return TrajectoryArrays(t, xyz, wp_idx,
+                            trajectory[0] if count else None,
+                            trajectory[-1] if count else None,
+                            phase)
+
+
+def waypoints_to_array(waypoints: Union[List[Dict], np.ndarray]) -> np.ndarray:
+    """
+    Pack waypoint dictionaries into a WAYPOINT_DTYPE structured array
+    
+    Args:
+        waypoints: List of waypoints with lat, lon, alt and optional cmd keys
+                   (structured arrays are returned unchanged)
+        
+    Returns:
+        Structured array with one record per waypoint
+    """
+    if isinstance(waypoints, np.ndarray):
+        return waypoints
+    
+    return np.array([(wp['lat'], wp['lon'], wp['alt'], wp.get('cmd', 16)) for wp in waypoints],
+                    dtype=WAYPOINT_DTYPE)
+
+
+def build_flight_trajectory(waypoints: Union[List[Dict], np.ndarray], coordinate_system: EarthCoordinateSystem,
+                            takeoff_config: TakeoffConfig, speed: float) -> TrajectoryArrays:
+    """
+    Build a realistic flight trajectory (taxi, takeoff, hover, auto mission) for a mission
+    
+    Args:
+        waypoints: Mission waypoints as dictionaries or a WAYPOINT_DTYPE array; the first one is HOME
+        coordinate_system: Coordinate system with the mission origin set
+        takeoff_config: Takeoff altitude and hover time
+        speed: Cruise speed in m/s
+        
+    Returns:
+        TrajectoryArrays for the mission (empty for fewer than 2 waypoints)
+    """
+    if len(waypoints) < 2:
+        return to_arrays([])
+    
+    # Convert all waypoints to local meters in one batch
+    wps = waypoints_to_array(waypoints)
+    wp_x, wp_y = coordinate_system.lat_lon_to_meters_batch(wps['lat'], wps['lon'])
+    wp_z = wps['alt']
+    home_x, home_y = float(wp_x[0]), float(wp_y[0])
+    takeoff_altitude = takeoff_config.takeoff_altitude
+    
+    # Phase 1: Ground taxi (0-2s)
+    # Phase 2: Takeoff (2-7s)
+    takeoff_time = 2.0
+    climb_duration = 5.0
+    climb_t = np.linspace(takeoff_time, takeoff_time + climb_duration, 20)
+    climb_z = (climb_t - takeoff_time) / climb_duration * takeoff_altitude
+    
+    # Phase 3: Hover wait (7-9s)
+    hover_end_time = takeoff_time + climb_duration + takeoff_config.hover_time
+    
+    # Phase 4: Auto mission, one leg per waypoint after HOME starting from the hover point
+    leg_end = np.column_stack([wp_x[1:], wp_y[1:], wp_z[1:]])
+    leg_start = np.vstack([(home_x, home_y, takeoff_altitude), leg_end[:-1]])
+    deltas = leg_end - leg_start
+    distances = np.linalg.norm(deltas, axis=1)
+    flight_times = distances / speed
+    
+    # Arrival times accumulate leg by leg, starting at the end of the hover
+    arrival_t = np.cumsum(np.concatenate(([hover_end_time], flight_times)))[1:]
+    
+    # Legs longer than 10m get intermediate points every ~10m; each leg contributes
+    # its intermediate points plus the waypoint itself
+    num_segments = np.where(distances > 10, np.maximum(2, (distances / 10).astype(np.int64)), 1)
+    leg = np.repeat(np.arange(len(leg_end)), num_segments)
+    seg = np.arange(len(leg)) - np.repeat(np.cumsum(num_segments) - num_segments, num_segments) + 1
+    ratio = seg / num_segments[leg]
+    is_waypoint = seg == num_segments[leg]
+    
+    auto_t = np.where(is_waypoint, arrival_t[leg], arrival_t[leg] - flight_times[leg] * (1 - ratio))
+    auto_xyz = leg_start[leg] + ratio[:, None] * deltas[leg]
+    auto_xyz[is_waypoint] = leg_end
+    
+    # Waypoint indices start at 2 for the first mission waypoint; intermediate points
+    # carry the index before it
+    auto_wp = np.where(is_waypoint, leg + 2, leg + 1)
+    
+    count = len(auto_t)
+    t = np.concatenate(([0.0], climb_t, [hover_end_time], auto_t))
+    xyz = np.empty((22 + count, 3))
+    xyz[:22, 0] = home_x
+    xyz[:22, 1] = home_y
+    xyz[0, 2] = 0.0
+    xyz[1:21, 2] = climb_z
+    xyz[21, 2] = takeoff_altitude
+    xyz[22:] = auto_xyz
+    wp_idx = np.concatenate(([0], np.repeat([0, 1], 10), [1], auto_wp)).astype(np.int32)
+    phase = np.concatenate((
+        [FlightPhase.TAXI], np.full(20, FlightPhase.TAKEOFF), [FlightPhase.HOVER],
+        np.full(count, FlightPhase.AUTO)
+    )).astype(np.int8)
+    
+    # Interpolation returns copies of the boundary points, so keep them as full records
+    home_wp, last_wp = wps[0].item(), wps[-1].item()
+    first_point = {
+        'x': home_x, 'y': home_y, 'z': 0,
+        'time': 0.0, 'phase': FlightPhase.TAXI,
+        'lat': home_wp[0], 'lon': home_wp[1], 'alt': 0,
+        'waypoint_index': 0
+    }
+    last_x, last_y, last_z = leg_end[-1].tolist()
+    last_point = {
+        'x': last_x, 'y': last_y, 'z': last_z,
+        'time': float(t[-1]), 'phase': FlightPhase.AUTO,
+        'lat': last_wp[0], 'lon': last_wp[1], 'alt': last_wp[2],
+        'waypoint_index': len(wps)
+    }
+    
+    return TrajectoryArrays(t, xyz, wp_idx, first_point, last_point, phase)
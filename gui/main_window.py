@@ -54,6 +54,14 @@ class MainWindow:
         # Setup focus
         self.window.focus_set()
         
+        # Prime psutil's CPU counter so the System Information dialog reports
+        # usage since now instead of 0.0 on its first non-blocking sample
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
+        
         logger.info("Main window created successfully")
         return self.window
     
@@ -139,6 +147,11 @@ class MainWindow:
             accelerator="Ctrl+S"
         )
         
+        file_menu.add_command(
+            label="Export Missions Archive",
+            command=lambda: self._execute_callback('export_modified_missions_aggregated')
+        )
+        
         file_menu.add_command(
             label="Export Collision Log",
             command=lambda: self._execute_callback('export_collision_log'),
@@ -472,7 +485,7 @@ or contact the development team.
 
 🔧 CPU:
   Cores: {psutil.cpu_count()}
-  Usage: {psutil.cpu_percent(interval=1)}%
+  Usage: {psutil.cpu_percent(interval=None)}%
 
 📚 Libraries:
   Matplotlib: {matplotlib.__version__}
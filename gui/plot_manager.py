@@ -8,11 +8,15 @@ Advanced 3D visualization with Blender-style collision markers and mouse control
 import tkinter as tk
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+from matplotlib.colors import to_rgba
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
 import logging
 from typing import Dict, List, Tuple, Optional, Callable
 from config.settings import SimulatorConfig, AxisLabels, FlightPhase, TakeoffConfig
+from core.trajectory import TrajectoryArrays, to_arrays
+from core._kernels import batch_interp
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,9 @@ class Plot3DManager:
     Features mouse wheel zoom, view controls, and Blender-style collision markers
     """
     
+    # Parsed RGBA tuples of drone color strings, shared by all plot managers
+    _rgba_cache: Dict[str, Tuple[float, float, float, float]] = {}
+    
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.fig: Optional[plt.Figure] = None
@@ -35,6 +42,57 @@ class Plot3DManager:
         self.current_time: float = 0.0
         self.safety_distance: float = 5.0
         
+        # Per-drone SoA trajectory arrays: drone_id -> (id(trajectory), len(trajectory), arrays)
+        self._traj_arrays: Dict[str, Tuple[int, int, TrajectoryArrays]] = {}
+        
+        # Arrays of the drones with a non-empty trajectory in the current data set
+        self._arrays: Dict[str, TrajectoryArrays] = {}
+        
+        # Per-drone position bounds: drone_id -> (id(trajectory), len(trajectory), lower, upper),
+        # and the combined (lower, upper) bounds of the current data set
+        self._bounds_cache: Dict[str, Tuple[int, int, np.ndarray, np.ndarray]] = {}
+        self._data_bounds: Optional[Tuple[List[float], List[float]]] = None
+        
+        # Trajectories packed back to back for batched interpolation, and the
+        # interpolated positions, point counts and phases of the current frame
+        self._pack_trajectories()
+        self._current_positions: Dict[str, Dict] = {}
+        
+        # Fingerprints of the loaded scene and of the last dynamic update, a flag forcing
+        # the next update through and one requesting a static artist refresh
+        self._scene_fingerprint: Optional[Tuple] = None
+        self._last_fingerprint: Optional[Tuple] = None
+        self._dirty = False
+        self._scene_pending = False
+        
+        # Persistent artists updated in place every frame and blitted over a cached background
+        self._background = None
+        self._artist_signature: Tuple = ()
+        self._drone_artists: Dict = {}
+        self._drone_order: List[str] = []
+        self._drone_rgba: np.ndarray = np.empty((0, 4))
+        
+        # Static artist signature and point counts the flown paths were last built from
+        self._flown_key: Optional[Tuple] = None
+        
+        # Drone sprite template: triangles of body, arms and rotor disks, and label offset
+        # relative to the body
+        size = 2.0
+        self._drone_polys = self._build_drone_polys(size)
+        self._label_off = np.array([0, 0, size + 2])
+        self._warning_artists: Optional[Dict] = None
+        self._info_artist = None
+        self._collision_info_artist = None
+        self._formation_spacing = getattr(TakeoffConfig(), 'formation_spacing', 6.0)
+        
+        # Coalesced redraw state (Tk after() token and accumulated scroll zoom)
+        self._pending_draw = None
+        self._pending_scale = 1.0
+        
+        # View motion state (Tk after() token and path simplification to restore)
+        self._motion_token = None
+        self._idle_simplify_threshold = 0.1
+        
         # Callbacks
         self.callbacks: Dict[str, Callable] = {}
         
@@ -51,7 +109,7 @@ class Plot3DManager:
     def register_callback(self, event_name: str, callback: Callable) -> None:
         """Register callback for plot events"""
         self.callbacks[event_name] = callback
-        logger.debug(f"Registered plot callback: {event_name}")
+        logger.debug("Registered plot callback: %s", event_name)
     
     def setup_plot(self) -> tk.Frame:
         """
@@ -62,14 +120,11 @@ class Plot3DManager:
         """
         logger.info("Setting up 3D plot")
         
-        # Use dark background style
-        plt.style.use('dark_background')
-        
         # Create high resolution figure
         self.fig = plt.figure(
             figsize=SimulatorConfig.FIGURE_SIZE,
             facecolor=SimulatorConfig.UI_COLORS['background'],
-            dpi=SimulatorConfig.DPI
+            dpi=SimulatorConfig.INTERACTIVE_DPI
         )
         
         # Create 3D subplot
@@ -97,6 +152,9 @@ class Plot3DManager:
         # Enable mouse interactions
         self._enable_mouse_controls()
         
+        # Enable blitting of per-frame updates
+        self._init_blitting()
+        
         # Set initial view
         self.set_view_mode('top')
         
@@ -172,29 +230,10 @@ class Plot3DManager:
         """Enable mouse wheel zoom and other controls"""
         def on_scroll(event):
             if event.inaxes == self.ax:
-                # Get current axis limits
-                xlim = self.ax.get_xlim()
-                ylim = self.ax.get_ylim()
-                zlim = self.ax.get_zlim()
-                
-                # Zoom factor
-                scale_factor = 1.1 if event.button == 'down' else 1/1.1
-                
-                # Calculate new limits around center
-                x_center = (xlim[0] + xlim[1]) / 2
-                y_center = (ylim[0] + ylim[1]) / 2
-                z_center = (zlim[0] + zlim[1]) / 2
-                
-                x_range = (xlim[1] - xlim[0]) * scale_factor / 2
-                y_range = (ylim[1] - ylim[0]) * scale_factor / 2
-                z_range = (zlim[1] - zlim[0]) * scale_factor / 2
-                
-                # Set new limits
-                self.ax.set_xlim(x_center - x_range, x_center + x_range)
-                self.ax.set_ylim(y_center - y_range, y_center + y_range)
-                self.ax.set_zlim(max(0, z_center - z_range), z_center + z_range)
-                
-                self.canvas.draw_idle()
+                # Accumulate zoom factor, applied once on the next coalesced redraw
+                self._pending_scale *= 1.1 if event.button == 'down' else 1/1.1
+                self._begin_motion()
+                self._schedule_draw()
         
         # Connect mouse events
         self.canvas.mpl_connect('scroll_event', on_scroll)
@@ -206,8 +245,68 @@ class Plot3DManager:
         
         self.canvas.mpl_connect('button_press_event', on_double_click)
         
+        # Dragging rotates the view
+        def on_motion(event):
+            if event.inaxes == self.ax and event.button is not None:
+                self._begin_motion()
+        
+        self.canvas.mpl_connect('motion_notify_event', on_motion)
+        
         logger.debug("Mouse controls enabled")
     
+    def _begin_motion(self) -> None:
+        """Use coarser path simplification while the view is being moved"""
+        if self._motion_token is None:
+            self._idle_simplify_threshold = plt.rcParams['path.simplify_threshold']
+            plt.rcParams['path.simplify_threshold'] = SimulatorConfig.MOTION_SIMPLIFY_THRESHOLD
+        else:
+            self.parent.after_cancel(self._motion_token)
+        self._motion_token = self.parent.after(SimulatorConfig.MOTION_SETTLE_MS, self._end_motion)
+    
+    def _end_motion(self) -> None:
+        """Restore full path quality once the view has settled"""
+        self._motion_token = None
+        plt.rcParams['path.simplify_threshold'] = self._idle_simplify_threshold
+        self._schedule_draw()
+    
+    def _apply_zoom(self, scale_factor: float) -> None:
+        """Scale the axis limits around their center"""
+        # Get current axis limits
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        zlim = self.ax.get_zlim()
+        
+        # Calculate new limits around center
+        x_center = (xlim[0] + xlim[1]) / 2
+        y_center = (ylim[0] + ylim[1]) / 2
+        z_center = (zlim[0] + zlim[1]) / 2
+        
+        x_range = (xlim[1] - xlim[0]) * scale_factor / 2
+        y_range = (ylim[1] - ylim[0]) * scale_factor / 2
+        z_range = (zlim[1] - zlim[0]) * scale_factor / 2
+        
+        # Set new limits
+        self.ax.set_xlim(x_center - x_range, x_center + x_range)
+        self.ax.set_ylim(y_center - y_range, y_center + y_range)
+        self.ax.set_zlim(max(0, z_center - z_range), z_center + z_range)
+    
+    def _schedule_draw(self) -> None:
+        """Request a full redraw, coalescing requests into one per ~16 ms"""
+        # Blitting over a background that is about to change would show stale content
+        self._background = None
+        if self._pending_draw is None:
+            self._pending_draw = self.parent.after(16, self._do_draw)
+    
+    def _do_draw(self) -> None:
+        """Run the coalesced redraw"""
+        self._pending_draw = None
+        
+        if self._pending_scale != 1.0:
+            self._apply_zoom(self._pending_scale)
+            self._pending_scale = 1.0
+        
+        self.canvas.draw_idle()
+    
     def set_view_mode(self, mode: str) -> None:
         """
         Set predefined view mode
@@ -228,172 +327,416 @@ class Plot3DManager:
             self.fit_view()
             return
         
-        self.canvas.draw_idle()
-        logger.debug(f"View mode set to: {mode}")
+        self._schedule_draw()
+        logger.debug("View mode set to: %s", mode)
     
     def fit_view(self) -> None:
         """Fit view to show all data"""
         if not self.drone_data:
             return
         
-        # Collect all coordinates
-        all_x, all_y, all_z = [], [], []
-        
-        for drone_data in self.drone_data.values():
-            trajectory = drone_data.get('trajectory', [])
-            if trajectory:
-                all_x.extend([p['x'] for p in trajectory])
-                all_y.extend([p['y'] for p in trajectory])
-                all_z.extend([p['z'] for p in trajectory])
-        
-        if all_x and all_y and all_z:
-            margin = self.view_settings['margin']
-            self.ax.set_xlim(min(all_x) - margin, max(all_x) + margin)
-            self.ax.set_ylim(min(all_y) - margin, max(all_y) + margin)
-            self.ax.set_zlim(0, max(all_z) + margin)
+        self._fit_limits(force=True)
+        self._schedule_draw()
+        logger.debug("View fitted to data")
+    
+    def _fit_limits(self, force: bool = False) -> bool:
+        """
+        Set axis limits to the data bounds
+        
+        Args:
+            force: Apply limits even if they did not change
             
-            self.canvas.draw_idle()
-            logger.debug("View fitted to data")
+        Returns:
+            True if the axis limits were changed
+        """
+        if self._data_bounds is None:
+            return False
+        
+        # Bounds of all trajectory points
+        lower, upper = self._data_bounds
+        
+        margin = self.view_settings['margin']
+        xlim = (lower[0] - margin, upper[0] + margin)
+        ylim = (lower[1] - margin, upper[1] + margin)
+        zlim = (0, upper[2] + margin)
+        
+        # Skip limits that barely moved so steady frames can be blitted
+        if not force:
+            current = (self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_zlim())
+            if np.allclose(current, (xlim, ylim, zlim), rtol=0, atol=margin * 0.01):
+                return False
+        
+        self.ax.set_xlim(*xlim)
+        self.ax.set_ylim(*ylim)
+        self.ax.set_zlim(*zlim)
+        return True
     
     def update_plot(self, drone_data: Dict, collision_warnings: List[Dict], 
                    current_time: float, safety_distance: float) -> None:
         """
         Update the 3D plot with current data
         
+        Reloads the scene when the drone set or trajectories changed, then
+        updates the dynamic artists.
+        
         Args:
             drone_data: Dictionary containing drone trajectory data
             collision_warnings: List of current collision warnings
             current_time: Current simulation time
             safety_distance: Current safety distance setting
         """
-        # Store data
+        if self._get_scene_fingerprint(drone_data) != self._scene_fingerprint:
+            self.set_scene(drone_data)
+        self.update_dynamic(collision_warnings, current_time, safety_distance)
+    
+    def set_scene(self, drone_data: Dict) -> None:
+        """
+        Load drone trajectories for display
+        
+        Call when missions are loaded or trajectories change; static artists
+        (planned trajectories, waypoints) are refreshed on the next update.
+        
+        Args:
+            drone_data: Dictionary containing drone trajectory data
+        """
         self.drone_data = drone_data
+        self._scene_fingerprint = self._get_scene_fingerprint(drone_data)
+        self._normalize_data(drone_data)
+        self._scene_pending = True
+        self._dirty = True
+    
+    @staticmethod
+    def _get_scene_fingerprint(drone_data: Dict) -> Tuple:
+        """Identify the drone set and the identity and length of each trajectory"""
+        return (id(drone_data),
+                tuple((id(data.get('trajectory')), len(data.get('trajectory', [])))
+                      for data in drone_data.values()))
+    
+    def update_dynamic(self, collision_warnings: List[Dict], current_time: float, 
+                       safety_distance: float) -> None:
+        """
+        Update drone models, flown paths, warnings and info text for the loaded scene
+        
+        Args:
+            collision_warnings: List of current collision warnings
+            current_time: Current simulation time
+            safety_distance: Current safety distance setting
+        """
+        # Skip frames that would redraw exactly the same content (e.g. while paused)
+        fingerprint = (current_time, safety_distance, len(collision_warnings))
+        if fingerprint == self._last_fingerprint and not self._dirty:
+            return
+        self._last_fingerprint = fingerprint
+        self._dirty = False
+        
+        # Store data
         self.collision_warnings = collision_warnings
         self.current_time = current_time
         self.safety_distance = safety_distance
         
-        # Clear and redraw
-        self.ax.clear()
-        self._setup_plot_style()
+        # Interpolate every drone once per frame in one batched call;
+        # models, flown paths and warnings share the result
+        self._interpolate_frame(current_time)
         
-        if not drone_data:
-            self._add_info_text()
-            self.canvas.draw_idle()
-            return
+        # Static artists (planned trajectories, waypoints) only change with the scene
+        needs_full_draw = False
+        if self._scene_pending:
+            needs_full_draw = self._sync_drone_artists()
+            self._scene_pending = False
         
-        # Draw trajectories and drones
+        # Update dynamic artists in place
         self._draw_trajectories()
         self._draw_current_positions()
         self._draw_collision_warnings()
         
         # Auto-fit view if enabled
-        if self.view_settings['auto_fit']:
-            self.fit_view()
+        if self.drone_data and self.view_settings['auto_fit'] and self._fit_limits():
+            needs_full_draw = True
         
         # Add information text
         self._add_info_text()
         
-        self.canvas.draw_idle()
+        if needs_full_draw or self._background is None:
+            # Background is recaptured in _on_draw once the full redraw happens
+            self._schedule_draw()
+        else:
+            self._blit()
     
-    def _draw_trajectories(self) -> None:
-        """Draw drone trajectories"""
-        for drone_id, data in self.drone_data.items():
-            trajectory = data.get('trajectory', [])
-            color = data.get('color', '#ffffff')
-            
-            if not trajectory:
+    def mark_dirty(self) -> None:
+        """Force the next update_plot call to redraw (e.g. after trajectories were modified in place)"""
+        self._dirty = True
+    
+    def _init_blitting(self) -> None:
+        """Capture the static background after every full canvas draw"""
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _on_draw(self, event) -> None:
+        """Handle full canvas draws: store the background and paint animated artists on top"""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        # Draws made by savefig use the export resolution, not the screen one
+        if self.canvas.is_saving():
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+    
+    def _blit(self) -> None:
+        """Repaint only the animated artists over the cached background"""
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+    
+    def _draw_animated(self) -> None:
+        """Draw all animated artists"""
+        for artist in self._animated_artists():
+            if not artist.get_visible():
                 continue
+            # 3D collections project their vertices outside of draw()
+            if hasattr(artist, 'do_3d_projection'):
+                artist.do_3d_projection()
+            self.ax.draw_artist(artist)
+    
+    def _animated_artists(self) -> List:
+        """Collect animated artists in drawing order"""
+        artists = []
+        if self._drone_artists:
+            artists.append(self._drone_artists['flown'])
+            artists.append(self._drone_artists['altitude'])
+            artists.extend(self._drone_artists['bodies'].values())
+            artists.append(self._drone_artists['sprites'])
+            artists.extend(self._drone_artists['labels'].values())
+        if self._warning_artists is not None:
+            artists.append(self._warning_artists['lines'])
+            artists.append(self._warning_artists['markers'])
+            artists.extend(self._warning_artists['labels'])
+        if self._info_artist is not None:
+            artists.append(self._info_artist)
+            artists.append(self._collision_info_artist)
+        return artists
+    
+    def _sync_drone_artists(self) -> bool:
+        """
+        Refresh static drone artists when the drone set or trajectories change
+        
+        Returns:
+            True if static content changed and the background must be redrawn
+        """
+        signature = tuple(
+            (drone_id, id(data.get('trajectory', [])), len(data.get('trajectory', [])), 
+             data.get('color', '#ffffff'))
+            for drone_id, data in self.drone_data.items()
+        )
+        if signature == self._artist_signature:
+            return False
+        
+        self._drone_order = list(self._arrays)
+        self._drone_rgba = np.array([self._get_rgba(self.drone_data[drone_id].get('color', '#ffffff'))
+                                     for drone_id in self._drone_order]).reshape(-1, 4)
+        if not self._drone_artists:
+            self._create_drone_artists()
+        self._update_static_artists()
+        
+        self._artist_signature = signature
+        return True
+    
+    @classmethod
+    def _get_rgba(cls, color: str) -> Tuple[float, float, float, float]:
+        """Convert a color string to RGBA, parsing each distinct color only once"""
+        rgba = cls._rgba_cache.get(color)
+        if rgba is None:
+            rgba = cls._rgba_cache[color] = to_rgba(color)
+        return rgba
+    
+    def _create_drone_artists(self) -> None:
+        """Create the shared collections holding all drones"""
+        # Complete trajectories (dashed lines) and waypoints are static
+        planned = Line3DCollection([], linewidths=1.5, linestyles='--', alpha=0.4)
+        waypoints = self.ax.scatter([0], [0], [0], s=25, alpha=0.6, marker='.')
+        
+        # Flown paths and drone models are redrawn every frame
+        flown = Line3DCollection([], linewidths=4, alpha=0.9, animated=True)
+        altitude = Line3DCollection([], linewidths=1, alpha=0.3, linestyles=':', animated=True)
+        
+        # Quadcopter models of flying drones, all drawn as one polygon collection
+        sprites = Poly3DCollection([], alpha=0.9, linewidths=0, animated=True)
+        for collection in (planned, flown, altitude, sprites):
+            # Start empty, so keep them out of the data limits
+            self.ax.add_collection(collection, autolim=False)
+        
+        # One body collection per ground phase style
+        bodies = {
+            FlightPhase.TAXI: self.ax.scatter([0], [0], [0], s=100, marker='s',
+                                              alpha=0.8, edgecolors='white', linewidth=1,
+                                              depthshade=False, animated=True),
+            FlightPhase.TAKEOFF: self.ax.scatter([0], [0], [0], s=150, marker='^',
+                                                 alpha=0.9, edgecolors='white', linewidth=2,
+                                                 depthshade=False, animated=True)
+        }
+        
+        self._drone_artists = {
+            'planned': planned,
+            'waypoints': waypoints,
+            'flown': flown,
+            'altitude': altitude,
+            'bodies': bodies,
+            'sprites': sprites,
+            'labels': {}
+        }
+        for artist in (flown, altitude, sprites, *bodies.values()):
+            artist.set_visible(False)
+    
+    @staticmethod
+    def _build_drone_polys(size: float, disk_sides: int = 8) -> np.ndarray:
+        """
+        Build the quadcopter sprite as triangles relative to the drone position
+        
+        Args:
+            size: Distance from the body center to each rotor
+            disk_sides: Number of triangles per rotor disk
             
-            # Extract coordinates
-            x_coords = [p['x'] for p in trajectory]
-            y_coords = [p['y'] for p in trajectory]
-            z_coords = [p['z'] for p in trajectory]
-            
-            # Draw complete trajectory (dashed line)
-            self.ax.plot(x_coords, y_coords, z_coords,
-                        color=color, linewidth=1.5, alpha=0.4, linestyle='--',
-                        label=f'{drone_id} Planned')
+        Returns:
+            Triangle vertices, shape (F, 3, 3)
+        """
+        body, arm_width, rotor_radius, rotor_z = 0.35 * size, 0.06 * size, 0.35 * size, 0.2
+        
+        # Square body (two triangles)
+        corners = np.array([[-body, -body, 0], [body, -body, 0], [body, body, 0], [-body, body, 0]])
+        triangles = [corners[[0, 1, 2]], corners[[0, 2, 3]]]
+        
+        angles = np.linspace(0, 2 * np.pi, disk_sides + 1)
+        rim = np.column_stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)]) * rotor_radius
+        for direction in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            rotor = np.array([direction[0] * size, direction[1] * size, rotor_z])
             
-            # Draw waypoints
-            self.ax.scatter(x_coords, y_coords, z_coords,
-                           color=color, s=25, alpha=0.6, marker='.')
+            # Arm as a thin quad from the body center to the rotor
+            side = np.array([-direction[1], direction[0], 0]) * arm_width
+            quad = np.array([side, rotor + side, rotor - side, -side])
+            triangles += [quad[[0, 1, 2]], quad[[0, 2, 3]]]
             
-            # Draw flown path (solid line)
-            flown_path = self._get_flown_path(trajectory, self.current_time)
+            # Rotor disk as a triangle fan
+            for i in range(disk_sides):
+                triangles.append(np.array([rotor, rotor + rim[i], rotor + rim[i + 1]]))
+        
+        return np.array(triangles, dtype=float)
+    
+    def _update_static_artists(self) -> None:
+        """Load the current trajectories into the static collections and sync drone labels"""
+        arrays = list(self._arrays.values())
+        self._set_segments(self._drone_artists['planned'], [traj.xyz for traj in arrays],
+                           self._drone_rgba)
+        
+        all_xyz = np.concatenate([traj.xyz for traj in arrays]) if arrays else np.empty((0, 3))
+        point_colors = np.repeat(self._drone_rgba, [len(traj) for traj in arrays], axis=0)
+        self._set_scatter(self._drone_artists['waypoints'], all_xyz, point_colors)
+        
+        # Only add or remove the labels of drones that joined or left
+        labels = self._drone_artists['labels']
+        for drone_id in labels.keys() - self._arrays.keys():
+            labels.pop(drone_id).remove()
+        for drone_id in self._drone_order:
+            if drone_id not in labels:
+                labels[drone_id] = self.ax.text(0, 0, 0, drone_id.split('_')[-1], fontsize=11,
+                                                color='white', weight='bold', ha='center',
+                                                va='bottom', visible=False, animated=True)
+    
+    @staticmethod
+    def _set_scatter(scatter, points: np.ndarray, colors: np.ndarray) -> None:
+        """Move a 3D scatter to new points, hiding it when empty"""
+        scatter.set_visible(len(points) > 0)
+        if len(points):
+            scatter._offsets3d = (points[:, 0], points[:, 1], points[:, 2])
+            scatter.set_facecolor(colors)
+    
+    @staticmethod
+    def _set_polys(collection: Poly3DCollection, polys: np.ndarray, colors: np.ndarray) -> None:
+        """Replace the polygons of a 3D polygon collection, hiding it when empty"""
+        collection.set_visible(len(polys) > 0)
+        if len(polys):
+            collection.set_verts(polys)
+            collection.set_facecolors(colors)
+    
+    @staticmethod
+    def _set_segments(collection: Line3DCollection, segments, colors: np.ndarray) -> None:
+        """Replace the segments of a 3D line collection, hiding it when empty"""
+        collection.set_visible(len(segments) > 0)
+        if len(segments):
+            collection.set_segments(segments)
+            collection.set_color(colors)
+    
+    def _draw_trajectories(self) -> None:
+        """Update flown paths of all drones"""
+        if not self._drone_artists:
+            return
+        
+        # Paths only change while a drone is between two points or has passed a new one;
+        # before takeoff and after landing they stay as they are
+        counts = self._frame_count
+        moving = np.any((counts > 0) & (counts < self._ends - self._starts))
+        flown_key = (self._artist_signature, counts.tobytes())
+        if not moving and flown_key == self._flown_key:
+            return
+        self._flown_key = flown_key
+        
+        segments, shown = [], []
+        for i, drone_id in enumerate(self._drone_order):
+            flown_path = self._get_flown_path(self._arrays[drone_id], int(self._frame_count[i]),
+                                              self._frame_xyz[i])
             if len(flown_path) > 1:
-                flown_x = [p['x'] for p in flown_path]
-                flown_y = [p['y'] for p in flown_path]
-                flown_z = [p['z'] for p in flown_path]
-                self.ax.plot(flown_x, flown_y, flown_z,
-                            color=color, linewidth=4, alpha=0.9,
-                            label=f'{drone_id} Flown')
+                segments.append(flown_path)
+                shown.append(i)
+        
+        self._set_segments(self._drone_artists['flown'], segments, self._drone_rgba[shown])
     
     def _draw_current_positions(self) -> None:
         """Draw current drone positions with models"""
-        for drone_id, data in self.drone_data.items():
-            trajectory = data.get('trajectory', [])
-            color = data.get('color', '#ffffff')
-            
-            if not trajectory:
-                continue
-            
-            # Get current position
-            current_pos = self._interpolate_position(trajectory, self.current_time)
-            if current_pos:
-                self._draw_drone_model(current_pos, color, drone_id)
-    
-    def _draw_drone_model(self, position: Dict, color: str, drone_id: str) -> None:
-        """Draw detailed drone model"""
-        x, y, z = position['x'], position['y'], position['z']
-        size = 2.0
+        if not self._drone_artists:
+            return
         
-        # Get flight phase
-        phase = position.get('phase', FlightPhase.AUTO)
-        
-        if phase == FlightPhase.TAXI:
-            # Ground taxi: small square
-            self.ax.scatter([x], [y], [z], s=100, c=[color], marker='s',
-                           alpha=0.8, edgecolors='white', linewidth=1)
-        elif phase == FlightPhase.TAKEOFF:
-            # Taking off: triangle
-            self.ax.scatter([x], [y], [z], s=150, c=[color], marker='^',
-                           alpha=0.9, edgecolors='white', linewidth=2)
-        else:
-            # Normal flight: detailed quadcopter model
-            # Main body
-            self.ax.scatter([x], [y], [z], s=200, c=[color], marker='s',
-                           alpha=0.9, edgecolors='white', linewidth=2)
-            
-            # Rotor arms and props
-            arms = [
-                (x + size, y, z + 0.2),
-                (x - size, y, z + 0.2),
-                (x, y + size, z + 0.2),
-                (x, y - size, z + 0.2)
-            ]
-            
-            # Draw rotors
-            arm_x, arm_y, arm_z = zip(*arms)
-            self.ax.scatter(arm_x, arm_y, arm_z, s=60, c=[color]*4,
-                           marker='o', alpha=0.8, edgecolors='white', linewidth=1)
-            
-            # Draw arms
-            for arm_x, arm_y, arm_z in arms:
-                self.ax.plot([x, arm_x], [y, arm_y], [z, arm_z],
-                            color=color, linewidth=2.5, alpha=0.8)
+        self._draw_drone_models(self._frame_xyz, self._frame_phase)
+    
+    def _draw_drone_models(self, positions: np.ndarray, phases: np.ndarray) -> None:
+        """
+        Move the detailed drone models by translating the sprite template
+        
+        Args:
+            positions: Current drone positions in drone order, shape (N, 3)
+            phases: Current flight phases in drone order, shape (N,)
+        """
+        bodies = self._drone_artists['bodies']
+        
+        # Ground taxi: small square, taking off: triangle, normal flight: quadcopter model
+        flying = ~np.isin(phases, list(bodies))
+        for phase, body in bodies.items():
+            mask = phases == phase
+            self._set_scatter(body, positions[mask], self._drone_rgba[mask])
         
-        # Drone label
-        label = drone_id.split('_')[-1]
-        self.ax.text(x, y, z + size + 2, label, fontsize=11, color='white',
-                    weight='bold', ha='center', va='bottom')
+        # Body, arms and rotor disks of all flying drones in one collection
+        face_count = len(self._drone_polys)
+        sprites = (positions[flying, None, None, :] + self._drone_polys[None]).reshape(-1, 3, 3)
+        self._set_polys(self._drone_artists['sprites'], sprites,
+                        np.repeat(self._drone_rgba[flying], face_count, axis=0))
         
-        # Altitude indicator line
-        if z > 0.1:
-            self.ax.plot([x, x], [y, y], [0, z],
-                        color=color, linewidth=1, alpha=0.3, linestyle=':')
+        # Drone labels
+        labels = self._drone_artists['labels']
+        for drone_id, label_position in zip(self._drone_order, positions + self._label_off):
+            label = labels[drone_id]
+            label.set_position_3d(label_position)
+            label.set_visible(True)
+        
+        # Altitude indicator lines
+        airborne = positions[:, 2] > 0.1
+        altitude_segments = np.repeat(positions[airborne, None, :], 2, axis=1)
+        altitude_segments[:, 0, 2] = 0
+        self._set_segments(self._drone_artists['altitude'], altitude_segments,
+                           self._drone_rgba[airborne])
     
     def _draw_collision_warnings(self) -> None:
         """Draw Blender-style collision warnings"""
+        if self._warning_artists is None:
+            self._create_warning_artists()
+        
+        segments, markers, sizes = [], [], []
+        labels = self._warning_artists['labels']
         for warning in self.collision_warnings:
             drone1, drone2 = warning['drone1'], warning['drone2']
             
@@ -401,79 +744,168 @@ class Plot3DManager:
             pos1 = self._get_current_drone_position(drone1)
             pos2 = self._get_current_drone_position(drone2)
             
-            if pos1 and pos2:
-                # Red warning line (Blender-style)
-                self.ax.plot([pos1['x'], pos2['x']],
-                            [pos1['y'], pos2['y']],
-                            [pos1['z'], pos2['z']],
-                            color='red', linewidth=4, alpha=0.8)
-                
-                # Collision point marker
-                mid_pos = warning['position']
-                marker_size = 500 if warning['severity'] == 'critical' else 300
-                
-                self.ax.scatter([mid_pos[0]], [mid_pos[1]], [mid_pos[2]],
-                               s=marker_size, c='red', marker='X',
-                               alpha=0.9, edgecolors='white', linewidth=3)
-                
-                # Distance label
-                distance_text = f"{warning['distance']:.1f}m"
-                self.ax.text(mid_pos[0], mid_pos[1], mid_pos[2] + 2, distance_text,
-                            fontsize=10, color='red', weight='bold',
-                            ha='center', va='bottom')
+            if not (pos1 and pos2):
+                continue
+            
+            # Red warning line (Blender-style)
+            segments.append(((pos1['x'], pos1['y'], pos1['z']),
+                             (pos2['x'], pos2['y'], pos2['z'])))
+            
+            # Collision point marker
+            mid_pos = warning['position']
+            markers.append(mid_pos)
+            sizes.append(500 if warning['severity'] == 'critical' else 300)
+            
+            # Distance label, from a pool grown on demand
+            if len(segments) > len(labels):
+                labels.append(self.ax.text(0, 0, 0, "", fontsize=10, color='red', weight='bold',
+                                           ha='center', va='bottom', animated=True))
+            text = labels[len(segments) - 1]
+            text.set_position_3d((mid_pos[0], mid_pos[1], mid_pos[2] + 2))
+            text.set_text(f"{warning['distance']:.1f}m")
+            text.set_visible(True)
+        
+        lines = self._warning_artists['lines']
+        lines.set_visible(bool(segments))
+        if segments:
+            lines.set_segments(segments)
+        
+        marker_artist = self._warning_artists['markers']
+        marker_artist.set_visible(bool(markers))
+        if markers:
+            xyz = np.asarray(markers, dtype=float)
+            marker_artist._offsets3d = (xyz[:, 0], xyz[:, 1], xyz[:, 2])
+            marker_artist.set_sizes(np.asarray(sizes, dtype=float))
+        
+        # Hide unused pooled labels
+        for text in labels[len(segments):]:
+            text.set_visible(False)
+    
+    def _create_warning_artists(self) -> None:
+        """Create the shared collision warning collections"""
+        lines = Line3DCollection([], colors='red', linewidths=4, alpha=0.8, animated=True)
+        self.ax.add_collection(lines, autolim=False)
+        markers = self.ax.scatter([0], [0], [0], s=300, c='red', marker='X',
+                                  alpha=0.9, edgecolors='white', linewidth=3,
+                                  depthshade=False, animated=True)
+        lines.set_visible(False)
+        markers.set_visible(False)
+        self._warning_artists = {'lines': lines, 'markers': markers, 'labels': []}
+    
+    def _normalize_data(self, drone_data: Dict) -> None:
+        """
+        Convert drone trajectories to SoA arrays once at ingest
+        
+        Trajectories are only reconverted when their identity or length changes,
+        so the per-frame code paths never touch the point dictionaries.
+        
+        Args:
+            drone_data: Dictionary containing drone trajectory data
+        """
+        previous_order = list(self._arrays)
+        changed = False
+        
+        self._arrays = {}
+        for drone_id, data in drone_data.items():
+            trajectory = data.get('trajectory', [])
+            if not len(trajectory):
+                continue
+            
+            key = (id(trajectory), len(trajectory))
+            cached = self._traj_arrays.get(drone_id)
+            if cached is None or cached[:2] != key:
+                cached = (*key, to_arrays(trajectory))
+                self._traj_arrays[drone_id] = cached
+                self._update_bounds(drone_id, *cached)
+                changed = True
+            self._arrays[drone_id] = cached[2]
+        
+        # Drop arrays of drones that left the data set
+        for drone_id in self._traj_arrays.keys() - drone_data.keys():
+            del self._traj_arrays[drone_id]
+            self._bounds_cache.pop(drone_id, None)
+        
+        if changed or previous_order != list(self._arrays):
+            self._pack_trajectories()
+            if self._arrays:
+                self._data_bounds = (
+                    np.min([self._bounds_cache[drone_id][2] for drone_id in self._arrays], axis=0).tolist(),
+                    np.max([self._bounds_cache[drone_id][3] for drone_id in self._arrays], axis=0).tolist()
+                )
+            else:
+                self._data_bounds = None
+    
+    def _update_bounds(self, drone_id: str, trajectory_id: int, length: int, 
+                       arrays: TrajectoryArrays) -> None:
+        """Update the position bounds of one drone, scanning only appended points when possible"""
+        cached = self._bounds_cache.get(drone_id)
+        if cached is not None and cached[0] == trajectory_id and cached[1] < length:
+            # Same trajectory grown in place: fold in the new points only
+            new_points = arrays.xyz[cached[1]:]
+            lower = np.minimum(cached[2], new_points.min(axis=0))
+            upper = np.maximum(cached[3], new_points.max(axis=0))
+        else:
+            lower = arrays.xyz.min(axis=0)
+            upper = arrays.xyz.max(axis=0)
+        self._bounds_cache[drone_id] = (trajectory_id, length, lower, upper)
     
     def _get_current_drone_position(self, drone_id: str) -> Optional[Dict]:
         """Get current position of a specific drone"""
-        if drone_id not in self.drone_data:
-            return None
-        
-        trajectory = self.drone_data[drone_id].get('trajectory', [])
-        return self._interpolate_position(trajectory, self.current_time)
-    
-    def _interpolate_position(self, trajectory: List[Dict], time: float) -> Optional[Dict]:
-        """Interpolate position at given time"""
-        if not trajectory:
-            return None
-        
-        # Boundary conditions
-        if time >= trajectory[-1]['time']:
-            return trajectory[-1]
-        if time <= trajectory[0]['time']:
-            return trajectory[0]
-        
-        # Linear interpolation
-        for i in range(len(trajectory) - 1):
-            t1, t2 = trajectory[i]['time'], trajectory[i + 1]['time']
-            if t1 <= time <= t2:
-                if t2 - t1 == 0:
-                    return trajectory[i]
-                
-                ratio = (time - t1) / (t2 - t1)
-                return {
-                    'x': trajectory[i]['x'] + ratio * (trajectory[i + 1]['x'] - trajectory[i]['x']),
-                    'y': trajectory[i]['y'] + ratio * (trajectory[i + 1]['y'] - trajectory[i]['y']),
-                    'z': trajectory[i]['z'] + ratio * (trajectory[i + 1]['z'] - trajectory[i]['z']),
-                    'time': time,
-                    'phase': trajectory[i].get('phase', FlightPhase.AUTO)
-                }
-        
-        return None
-    
-    def _get_flown_path(self, trajectory: List[Dict], current_time: float) -> List[Dict]:
-        """Get the portion of trajectory already flown"""
-        flown_path = []
-        
-        for point in trajectory:
-            if point['time'] <= current_time:
-                flown_path.append(point)
-            else:
-                # Add current interpolated position
-                current_pos = self._interpolate_position(trajectory, current_time)
-                if current_pos:
-                    flown_path.append(current_pos)
-                break
+        return self._current_positions.get(drone_id)
+    
+    def _pack_trajectories(self) -> None:
+        """Pack the current trajectories back to back for batched interpolation"""
+        arrays = list(self._arrays.values())
+        lengths = np.array([len(traj) for traj in arrays], dtype=np.int64)
+        self._ends = np.cumsum(lengths)
+        self._starts = self._ends - lengths
         
-        return flown_path
+        if arrays:
+            self._flat_t = np.concatenate([traj.t for traj in arrays])
+            self._flat_xyz = np.concatenate([traj.xyz for traj in arrays])
+            self._flat_phase = np.concatenate([traj.phase for traj in arrays])
+        else:
+            self._flat_t = np.empty(0)
+            self._flat_xyz = np.empty((0, 3))
+            self._flat_phase = np.empty(0, dtype=np.int8)
+        
+        self._frame_xyz = np.empty((len(arrays), 3))
+        self._frame_count = np.empty(len(arrays), dtype=np.int64)
+        self._frame_phase = np.empty(len(arrays), dtype=np.int8)
+    
+    def _interpolate_frame(self, current_time: float) -> None:
+        """Interpolate positions and flight phases of all drones at the current time"""
+        batch_interp(current_time, self._flat_t, self._flat_xyz, self._starts, self._ends,
+                     self._frame_xyz, self._frame_count)
+        
+        # Phase of the segment start, clamped to the first/last point outside the time span
+        last = self._ends - self._starts - 1
+        self._frame_phase = self._flat_phase[self._starts + np.clip(self._frame_count - 1, 0, last)]
+        
+        self._current_positions = {
+            drone_id: {'x': x, 'y': y, 'z': z, 'time': current_time, 'phase': phase}
+            for drone_id, (x, y, z), phase in zip(self._arrays, self._frame_xyz.tolist(),
+                                                  self._frame_phase.tolist())
+        }
+    
+    def _get_flown_path(self, arrays: TrajectoryArrays, count: int, 
+                        current_xyz: np.ndarray) -> np.ndarray:
+        """
+        Get the portion of trajectory already flown as an (N, 3) array
+        
+        Args:
+            arrays: Trajectory arrays of the drone
+            count: Number of points at or before the current time
+            current_xyz: Current interpolated position
+        """
+        if count == 0 or count == len(arrays):
+            return arrays.xyz[:count]
+        
+        # Add current interpolated position
+        path = np.empty((count + 1, 3))
+        path[:count] = arrays.xyz[:count]
+        path[count] = current_xyz
+        return path
     
     def _add_info_text(self) -> None:
         """Add information text overlay"""
@@ -484,19 +916,35 @@ class Plot3DManager:
         ]
         
         # Add formation spacing info if available
-        formation_spacing = getattr(TakeoffConfig(), 'formation_spacing', 6.0)
-        info_lines.append(f"Formation Spacing: {formation_spacing:.1f}m")
+        info_lines.append(f"Formation Spacing: {self._formation_spacing:.1f}m")
+        
+        if self._info_artist is None:
+            self._create_info_artists()
+        
+        # Display info
+        self._info_artist.set_text("\n".join(info_lines))
         
         # Add collision count
         if self.collision_warnings:
-            info_lines.append(f"⚠️ Collisions: {len(self.collision_warnings)}")
+            self._collision_info_artist.set_text(f"⚠️ Collisions: {len(self.collision_warnings)}")
+            self._collision_info_artist.set_visible(True)
+        else:
+            self._collision_info_artist.set_visible(False)
+    
+    def _create_info_artists(self) -> None:
+        """Create the information overlay text artists"""
+        self._info_artist = self.ax.text2D(0.02, 0.98, "",
+                                           transform=self.ax.transAxes, fontsize=10,
+                                           color=SimulatorConfig.UI_COLORS['accent'],
+                                           weight='bold', va='top', linespacing=1.6,
+                                           animated=True)
         
-        # Display info
-        for i, line in enumerate(info_lines):
-            color = '#ff5722' if '⚠️' in line else SimulatorConfig.UI_COLORS['accent']
-            self.ax.text2D(0.02, 0.98 - i*0.04, line,
-                          transform=self.ax.transAxes, fontsize=10,
-                          color=color, weight='bold')
+        # Collision count in its own color, anchored below the info block
+        self._collision_info_artist = self.ax.annotate(
+            "", xy=(0, 0), xycoords=self._info_artist,
+            xytext=(0, -7), textcoords='offset points',
+            fontsize=10, color='#ff5722', weight='bold', va='top', animated=True
+        )
     
     def add_custom_marker(self, position: Tuple[float, float, float],
                          text: str, color: str = 'yellow', size: int = 100) -> None:
@@ -513,7 +961,17 @@ class Plot3DManager:
         """Clear the plot"""
         self.ax.clear()
         self._setup_plot_style()
-        self.canvas.draw_idle()
+        
+        # Cleared artists must be recreated on the next update
+        self._artist_signature = ()
+        self._flown_key = None
+        self._dirty = True
+        self._scene_pending = True
+        self._drone_artists.clear()
+        self._warning_artists = None
+        self._info_artist = None
+        self._collision_info_artist = None
+        self._schedule_draw()
         logger.debug("Plot cleared")
     
     def save_plot(self, filename: str, dpi: int = 300) -> bool:
@@ -528,8 +986,12 @@ class Plot3DManager:
             True if successful
         """
         try:
+            # Renders at the export dpi; the on-screen figure keeps its interactive dpi
             self.fig.savefig(filename, dpi=dpi, bbox_inches='tight',
                             facecolor=SimulatorConfig.UI_COLORS['background'])
+            
+            # Saving replaces the canvas renderer, so redraw the screen image
+            self._schedule_draw()
             logger.info(f"Plot saved to: {filename}")
             return True
         except Exception as e:
@@ -545,7 +1007,7 @@ class Plot3DManager:
         self.view_settings.update(settings)
         self.ax.view_init(elev=settings.get('elevation', 30),
                          azim=settings.get('azimuth', 45))
-        self.canvas.draw_idle()
+        self._schedule_draw()
 
 
 # Example usage and testing
@@ -35,6 +35,17 @@ def main():
         plt.rcParams['agg.path.chunksize'] = 10000
         plt.rcParams['animation.html'] = 'jshtml'
         
+        # Dark theme: only the colors the plot does not set itself
+        plt.rcParams.update({
+            'figure.facecolor': '#1e1e1e',
+            'axes.facecolor': '#1e1e1e',
+            'axes.edgecolor': '#404040',
+            'axes.labelcolor': '#ffffff',
+            'text.color': '#ffffff',
+            'xtick.color': '#888888',
+            'ytick.color': '#888888'
+        })
+        
         logger.info("✅ Environment setup complete")
         logger.info("🎯 Version Features: Collision Detection, Mouse Zoom, 2x2 6m Takeoff, LOITER Avoidance, Collision Logging")
         
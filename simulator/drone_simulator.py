@@ -5,12 +5,19 @@ Advanced Drone Simulator - Main Simulator Class for v5.1
 Integrates all modules into a comprehensive drone swarm simulation system
 """
 
+import io
+import os
+import shutil
+import tarfile
 import time
-import math
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from pathlib import Path
 from tkinter import messagebox, filedialog
 
 # Import configuration
@@ -23,6 +30,8 @@ from core.coordinate_system import EarthCoordinateSystem
 from core.collision_logger import CollisionLogger
 from core.collision_avoidance import CollisionAvoidanceSystem
 from core.flight_manager import TakeoffManager, QGCWaypointGenerator
+from core.trajectory import TrajectoryArrays, to_arrays, build_flight_trajectory
+from core._kernels import interp_loiter
 
 # Import GUI modules
 from gui.main_window import MainWindow
@@ -71,10 +80,40 @@ class AdvancedDroneSimulator:
         self.is_playing = False
         self.modified_missions: Dict[str, List[str]] = {}
         
+        # Modified missions are rebuilt off the render thread, only for drones whose
+        # LOITER list changed; one worker keeps rebuilds of the same drone in order and
+        # the generation counter drops results made stale by a reset
+        self._missions_lock = threading.Lock()
+        self._missions_executor = ThreadPoolExecutor(max_workers=1)
+        self._missions_generation = 0
+        self._dirty_loiter_drones: set = set()
+        
+        # LOITER delays as arrays: drone_id -> (id(delays), len(delays), starts, durations)
+        self._loiter_arrays: Dict[str, Tuple[int, int, np.ndarray, np.ndarray]] = {}
+        
+        # Per-frame buffers reused across animation ticks
+        self._positions_buffer = np.empty((SimulatorConfig.MAX_DRONES, 3))
+        self._interp_buffer = np.empty(3)
+        self._status_parts: List[str] = []
+        self._last_status_text: Optional[str] = None
+        
+        # Encoded mission files of an export, grown to the largest export so far
+        self._export_buffer = bytearray()
+        # Last exported file per drone: drone_id -> (mission lines, path, size)
+        self._exported_missions: Dict[str, Tuple[List[str], Path, int]] = {}
+        
+        # Tk after() id of the coalesced redraw requested by slider changes
+        self._pending_replot: Optional[str] = None
+        
         # Performance optimization
         self.last_collision_check = 0.0
         self.update_interval = SimulatorConfig.UPDATE_INTERVAL
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
+        self._time_accumulator = 0.0
+        
+        # Current positions memoized per simulation time; reset whenever LOITER delays change
+        self._positions_key: Optional[float] = None
+        self._positions_cache: Optional[Tuple[List[str], np.ndarray, Dict[str, Dict]]] = None
         
         # GUI components
         self.main_window: Optional[MainWindow] = None
@@ -106,9 +145,9 @@ class AdvancedDroneSimulator:
             self._update_status_display()
             self._update_3d_plot()
             
-            # Log system information
+            # Log system information without holding up the first frames
             from utils.logging_config import log_system_info
-            log_system_info()
+            threading.Thread(target=log_system_info, name="system-info", daemon=True).start()
             
             logger.info("🎯 Simulator ready - GUI started")
             
@@ -159,6 +198,7 @@ class AdvancedDroneSimulator:
             'load_csv_files': self.load_csv_files,
             'create_test_mission': self.create_test_mission,
             'export_modified_missions': self.export_modified_missions,
+            'export_modified_missions_aggregated': self.export_modified_missions_aggregated,
             'export_collision_log': self.export_collision_log,
             'toggle_play': self.toggle_play,
             'stop_simulation': self.stop_simulation,
@@ -201,7 +241,8 @@ class AdvancedDroneSimulator:
         
         try:
             self.drones.clear()
-            self.modified_missions.clear()
+            self._clear_modified_missions()
+            self._positions_key = None
             
             # Set base coordinates (Taiwan area for testing)
             base_lat, base_lon = 24.0, 121.0
@@ -210,16 +251,22 @@ class AdvancedDroneSimulator:
             # Generate 2x2 takeoff formation with 6m spacing
             takeoff_positions = self.takeoff_manager.generate_takeoff_formation(base_lat, base_lon)
             
-            # Create mission for each drone
+            # Create waypoints for each drone
+            missions = {}
             for i in range(4):
-                drone_id = f"Drone_{i+1}"
                 takeoff_lat, takeoff_lon = takeoff_positions[i]
-                
-                # Create waypoints
-                waypoints = self._generate_test_waypoints(i, takeoff_lat, takeoff_lon, base_lat, base_lon)
-                
-                # Calculate trajectory
-                trajectory = self._calculate_realistic_trajectory(waypoints, drone_id)
+                missions[f"Drone_{i+1}"] = self._generate_test_waypoints(
+                    i, takeoff_lat, takeoff_lon, base_lat, base_lon
+                )
+            
+            # Calculate trajectories
+            trajectories = self._calculate_trajectories(missions)
+            
+            for i, (drone_id, waypoints) in enumerate(missions.items()):
+                takeoff_lat, takeoff_lon = takeoff_positions[i]
+                trajectory = trajectories[drone_id]
+                if isinstance(trajectory, Exception):
+                    raise trajectory
                 
                 # Store drone data
                 self.drones[drone_id] = {
@@ -231,6 +278,8 @@ class AdvancedDroneSimulator:
                     'loiter_delays': [],
                     'current_position': None
                 }
+                self.drones[drone_id]['status_prefix'] = self._format_status_prefix(
+                    drone_id, self.drones[drone_id])
                 
                 # Update status
                 self.control_panel.update_drone_status(f'drone_{i+1}', '✓ Ready', '#4caf50')
@@ -239,6 +288,7 @@ class AdvancedDroneSimulator:
             
             # Update simulation
             self._calculate_max_time()
+            self.plot_manager.set_scene(self.drones)
             self._update_status_display()
             self._update_3d_plot()
             
@@ -281,17 +331,20 @@ class AdvancedDroneSimulator:
         base_x, base_y = self.coordinate_system.lat_lon_to_meters(base_lat, base_lon)
         
         # Generate rectangular mission pattern
-        mission_points = [
+        mission_points = np.array([
             (base_x + offset_x, base_y + offset_y, 15),
             (base_x + offset_x + 80, base_y + offset_y, 15),
             (base_x + offset_x + 80, base_y + offset_y + 80, 15),
             (base_x + offset_x, base_y + offset_y + 80, 15),
             (base_x + offset_x, base_y + offset_y, 15)
-        ]
+        ])
         
-        # Convert to lat/lon and add to waypoints
-        for mx, my, mz in mission_points:
-            mlat, mlon = self.coordinate_system.meters_to_lat_lon(mx, my)
+        # Convert to lat/lon in one batch and add to waypoints
+        mission_lats, mission_lons = self.coordinate_system.meters_to_lat_lon_batch(
+            mission_points[:, 0], mission_points[:, 1]
+        )
+        for mlat, mlon, mz in zip(mission_lats.tolist(), mission_lons.tolist(),
+                                  mission_points[:, 2].tolist()):
             waypoints.append({
                 'lat': mlat,
                 'lon': mlon,
@@ -302,96 +355,30 @@ class AdvancedDroneSimulator:
         return waypoints
     
     @log_performance
-    def _calculate_realistic_trajectory(self, waypoints: List[Dict], drone_id: str) -> List[Dict]:
+    def _calculate_realistic_trajectory(self, waypoints: List[Dict], drone_id: str) -> TrajectoryArrays:
         """Calculate realistic trajectory with proper timing and phases"""
-        trajectory = []
-        total_time = 0.0
-        speed = SimulatorConfig.DEFAULT_CRUISE_SPEED
-        
-        if len(waypoints) < 2:
-            return trajectory
-        
-        # Phase 1: Ground taxi (0-2s)
-        home_wp = waypoints[0]
-        home_x, home_y = self.coordinate_system.lat_lon_to_meters(home_wp['lat'], home_wp['lon'])
-        
-        trajectory.append({
-            'x': home_x, 'y': home_y, 'z': 0,
-            'time': 0.0, 'phase': FlightPhase.TAXI,
-            'lat': home_wp['lat'], 'lon': home_wp['lon'], 'alt': 0,
-            'waypoint_index': 0
-        })
-        
-        # Phase 2: Takeoff (2-7s)
-        takeoff_time = 2.0
-        climb_duration = 5.0
-        
-        for i, t in enumerate(np.linspace(takeoff_time, takeoff_time + climb_duration, 20)):
-            progress = (t - takeoff_time) / climb_duration
-            altitude = progress * self.takeoff_config.takeoff_altitude
-            
-            trajectory.append({
-                'x': home_x, 'y': home_y, 'z': altitude,
-                'time': t, 'phase': FlightPhase.TAKEOFF,
-                'lat': home_wp['lat'], 'lon': home_wp['lon'], 'alt': altitude,
-                'waypoint_index': 0 if i < 10 else 1
-            })
-        
-        total_time = takeoff_time + climb_duration
-        
-        # Phase 3: Hover wait (7-9s)
-        hover_end_time = total_time + self.takeoff_config.hover_time
-        
-        trajectory.append({
-            'x': home_x, 'y': home_y, 'z': self.takeoff_config.takeoff_altitude,
-            'time': hover_end_time, 'phase': FlightPhase.HOVER,
-            'lat': home_wp['lat'], 'lon': home_wp['lon'], 'alt': self.takeoff_config.takeoff_altitude,
-            'waypoint_index': 1
-        })
+        trajectory = build_flight_trajectory(waypoints, self.coordinate_system, self.takeoff_config,
+                                             SimulatorConfig.DEFAULT_CRUISE_SPEED)
+        logger.debug(f"Calculated trajectory for {drone_id}: {len(trajectory)} points, {trajectory.t_max:.1f}s")
+        return trajectory
+    
+    def _calculate_trajectories(self, missions: Dict[str, List[Dict]]) -> Dict[str, Union[TrajectoryArrays, Exception]]:
+        """
+        Calculate trajectories for several missions
         
-        total_time = hover_end_time
-        
-        # Phase 4: Auto mission
-        prev_x, prev_y, prev_z = home_x, home_y, self.takeoff_config.takeoff_altitude
-        
-        for wp_idx, wp in enumerate(waypoints[1:], start=2):
-            x, y = self.coordinate_system.lat_lon_to_meters(wp['lat'], wp['lon'])
-            z = wp['alt']
-            
-            # Calculate flight time
-            distance = math.sqrt((x - prev_x)**2 + (y - prev_y)**2 + (z - prev_z)**2)
-            flight_time = distance / speed
-            total_time += flight_time
-            
-            # Add interpolation points for smooth trajectory
-            if distance > 10:
-                num_segments = max(2, int(distance / 10))
-                for seg in range(1, num_segments):
-                    ratio = seg / num_segments
-                    interp_time = total_time - flight_time + (flight_time * ratio)
-                    interp_x = prev_x + ratio * (x - prev_x)
-                    interp_y = prev_y + ratio * (y - prev_y)
-                    interp_z = prev_z + ratio * (z - prev_z)
-                    
-                    trajectory.append({
-                        'x': interp_x, 'y': interp_y, 'z': interp_z,
-                        'time': interp_time, 'phase': FlightPhase.AUTO,
-                        'lat': wp['lat'], 'lon': wp['lon'], 'alt': wp['alt'],
-                        'waypoint_index': wp_idx - 1
-                    })
-            
-            # Add actual waypoint
-            trajectory.append({
-                'x': x, 'y': y, 'z': z,
-                'time': total_time, 'phase': FlightPhase.AUTO,
-                'lat': wp['lat'], 'lon': wp['lon'], 'alt': wp['alt'],
-                'waypoint_index': wp_idx
-            })
+        Args:
+            missions: Waypoints by drone id
             
-            prev_x, prev_y, prev_z = x, y, z
-        
-        logger.debug(f"Calculated trajectory for {drone_id}: {len(trajectory)} points, {total_time:.1f}s")
-        return trajectory
+        Returns:
+            Trajectory by drone id, or the exception raised while calculating it
+        """
+        results = {}
+        for drone_id, waypoints in missions.items():
+            try:
+                results[drone_id] = self._calculate_realistic_trajectory(waypoints, drone_id)
+            except Exception as e:
+                results[drone_id] = e
+        return results
     
     def load_qgc_files(self) -> None:
         """Load QGC waypoint files"""
@@ -423,7 +410,8 @@ class AdvancedDroneSimulator:
         logger.info(f"📂 Loading {len(file_paths)} {file_type} files")
         
         self.drones.clear()
-        self.modified_missions.clear()
+        self._clear_modified_missions()
+        self._positions_key = None
         
         # Reset drone status
         for i in range(4):
@@ -431,42 +419,26 @@ class AdvancedDroneSimulator:
         
         loaded_count = 0
         
-        for i, file_path in enumerate(file_paths):
-            if i >= SimulatorConfig.MAX_DRONES:
-                logger.warning(f"Maximum {SimulatorConfig.MAX_DRONES} drones supported, ignoring additional files")
-                break
-            
+        if len(file_paths) > SimulatorConfig.MAX_DRONES:
+            logger.warning(f"Maximum {SimulatorConfig.MAX_DRONES} drones supported, ignoring additional files")
+            file_paths = file_paths[:SimulatorConfig.MAX_DRONES]
+        
+        # Read and parse all files concurrently using the factory
+        with ThreadPoolExecutor(max_workers=max(1, len(file_paths))) as pool:
+            parse_futures = [pool.submit(FileParserFactory.parse_mission_file, file_path)
+                             for file_path in file_paths]
+        
+        # Trajectories are then calculated in one batch
+        parsed = []
+        for i, (file_path, future) in enumerate(zip(file_paths, parse_futures)):
             try:
-                drone_id = f"Drone_{i+1}"
-                
-                # Parse file using factory
-                waypoints = FileParserFactory.parse_mission_file(file_path)
+                waypoints = future.result()
                 
                 if waypoints:
                     # Set coordinate origin from first file
                     if i == 0:
                         self.coordinate_system.set_origin(waypoints[0]['lat'], waypoints[0]['lon'])
-                    
-                    # Calculate trajectory
-                    trajectory = self._calculate_realistic_trajectory(waypoints, drone_id)
-                    
-                    # Store drone data
-                    self.drones[drone_id] = {
-                        'waypoints': waypoints,
-                        'trajectory': trajectory,
-                        'color': SimulatorConfig.DRONE_COLORS[i],
-                        'takeoff_position': (waypoints[0]['lat'], waypoints[0]['lon']),
-                        'phase': FlightPhase.TAXI,
-                        'loiter_delays': [],
-                        'file_path': file_path,
-                        'current_position': None
-                    }
-                    
-                    # Update status
-                    self.control_panel.update_drone_status(f'drone_{i+1}', f'✓ {drone_id}', '#4caf50')
-                    
-                    loaded_count += 1
-                    logger.info(f"✅ Loaded {drone_id}: {len(waypoints)} waypoints from {file_path}")
+                    parsed.append((i, file_path, waypoints))
                 else:
                     raise ValueError("No valid waypoints found")
                     
@@ -474,6 +446,43 @@ class AdvancedDroneSimulator:
                 logger.error(f"❌ Failed to load {file_path}: {e}")
                 self.control_panel.update_drone_status(f'drone_{i+1}', '✗ Error', '#f44336')
         
+        # Calculate trajectories
+        trajectories = self._calculate_trajectories(
+            {f"Drone_{i+1}": waypoints for i, _, waypoints in parsed}
+        )
+        
+        for i, file_path, waypoints in parsed:
+            drone_id = f"Drone_{i+1}"
+            trajectory = trajectories[drone_id]
+            
+            if isinstance(trajectory, Exception):
+                logger.error(f"❌ Failed to load {file_path}: {trajectory}")
+                self.control_panel.update_drone_status(f'drone_{i+1}', '✗ Error', '#f44336')
+                continue
+            
+            # Store drone data
+            self.drones[drone_id] = {
+                'waypoints': waypoints,
+                'trajectory': trajectory,
+                'color': SimulatorConfig.DRONE_COLORS[i],
+                'takeoff_position': (waypoints[0]['lat'], waypoints[0]['lon']),
+                'phase': FlightPhase.TAXI,
+                'loiter_delays': [],
+                'file_path': file_path,
+                'current_position': None
+            }
+            self.drones[drone_id]['status_prefix'] = self._format_status_prefix(
+                drone_id, self.drones[drone_id])
+            
+            # Update status
+            self.control_panel.update_drone_status(f'drone_{i+1}', f'✓ {drone_id}', '#4caf50')
+            
+            loaded_count += 1
+            logger.info(f"✅ Loaded {drone_id}: {len(waypoints)} waypoints from {file_path}")
+        
+        # Trajectories are uploaded to the plot once per load
+        self.plot_manager.set_scene(self.drones)
+        
         if loaded_count > 0:
             self._calculate_max_time()
             self._update_status_display()
@@ -524,8 +533,10 @@ class AdvancedDroneSimulator:
         # Clear delays and warnings
         for drone_data in self.drones.values():
             drone_data['loiter_delays'] = []
+        self._positions_key = None
+        self._calculate_max_time()
         
-        self.modified_missions.clear()
+        self._clear_modified_missions()
         self.collision_logger.clear_events()
         
         # Update displays
@@ -537,45 +548,57 @@ class AdvancedDroneSimulator:
     def _start_animation(self) -> None:
         """Start high-performance animation loop"""
         if self.animation:
-            self.animation.event_source.stop()
+            self.animation.stop()
         
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
+        self._time_accumulator = 0.0
+        sim_dt = SimulatorConfig.SIMULATION_TIMESTEP
+        last_status_time = last_plot_time = -float('inf')
         
-        def update_frame(frame):
+        def update_frame():
+            nonlocal last_status_time, last_plot_time
             if not self.is_playing or self.max_time == 0:
                 return
             
-            current_real_time = time.time()
-            dt = (current_real_time - self.last_update_time) * self.time_scale
-            self.last_update_time = current_real_time
+            # Advance simulated time in whole fixed steps so every frame samples
+            # trajectories on the same time grid regardless of timer jitter
+            now = time.monotonic()
+            self._time_accumulator += (now - self.last_update_time) * self.time_scale
+            self.last_update_time = now
             
-            self.current_time += dt
+            steps = int(self._time_accumulator / sim_dt)
+            if steps == 0:
+                return
+            self._time_accumulator -= steps * sim_dt
+            self.current_time += steps * sim_dt
             
             if self.current_time > self.max_time:
                 self.current_time = self.max_time
                 self.toggle_play()
                 return
             
-            # Update UI (reduced frequency for performance)
-            if frame % 2 == 0:
+            # Status text and 3D plot refresh on their own wall-clock budgets,
+            # independent of how often the timer fires
+            if now - last_status_time >= SimulatorConfig.STATUS_UPDATE_INTERVAL:
+                last_status_time = now
                 self.control_panel.set_variable_value('time_var', self.current_time)
                 self.control_panel.update_time_display(self.current_time, self.max_time)
                 self._update_status_display()
             
-            # Update 3D plot
-            self._update_3d_plot()
+            if now - last_plot_time >= SimulatorConfig.PLOT_UPDATE_INTERVAL:
+                last_plot_time = now
+                self._update_3d_plot()
         
-        # Import animation here to avoid circular imports
-        import matplotlib.animation as animation
-        self.animation = animation.FuncAnimation(
-            self.plot_manager.fig, update_frame, 
-            interval=self.update_interval, blit=False
-        )
+        # Drive frames from a plain canvas timer: the plot manager blits its own
+        # updates, so a FuncAnimation forcing a full redraw every tick is not needed
+        self.animation = self.plot_manager.canvas.new_timer(interval=self.update_interval)
+        self.animation.add_callback(update_frame)
+        self.animation.start()
     
     def _stop_animation(self) -> None:
         """Stop animation"""
         if self.animation:
-            self.animation.event_source.stop()
+            self.animation.stop()
             self.animation = None
     
     @log_performance
@@ -585,12 +608,14 @@ class AdvancedDroneSimulator:
             return
         
         # Get current positions
-        current_positions = self._get_current_positions()
+        drone_ids, positions_array, current_positions = self._get_current_positions()
         
         # Collision detection (throttled for performance)
         warnings = []
         if self.current_time - self.last_collision_check >= self.safety_config.collision_check_interval:
-            warnings, new_loiters = self.collision_system.check_collisions(current_positions, self.current_time)
+            warnings, new_loiters = self.collision_system.check_collisions_array(
+                drone_ids, positions_array, current_positions, self.current_time
+            )
             
             # Apply new LOITER delays
             for drone_id, loiter_time in new_loiters.items():
@@ -599,36 +624,59 @@ class AdvancedDroneSimulator:
                         'start_time': self.current_time,
                         'duration': loiter_time
                     })
+                    self._dirty_loiter_drones.add(drone_id)
+                    self._positions_key = None
+            
+            # Delayed drones finish later, so playback has to run longer
+            if new_loiters:
+                self._calculate_max_time()
             
             self.last_collision_check = self.current_time
             
             # Update warning display
             self._update_warning_display(warnings)
             
-            # Generate modified missions if needed
-            if warnings and not self.modified_missions:
-                self._generate_modified_missions(new_loiters)
+            # Regenerate modified missions for drones whose LOITER list changed
+            if warnings and self._dirty_loiter_drones:
+                self._start_mission_regeneration()
         
-        # Update 3D plot
-        self.plot_manager.update_plot(
-            self.drones,
+        # Update the moving parts of the 3D plot; trajectories were set on load
+        self.plot_manager.update_dynamic(
             warnings,
             self.current_time,
             self.safety_config.safety_distance
         )
     
-    def _get_current_positions(self) -> Dict[str, Dict]:
-        """Get current positions of all drones"""
+    def _get_current_positions(self) -> Tuple[List[str], np.ndarray, Dict[str, Dict]]:
+        """
+        Get current positions of all drones
+        
+        Returns:
+            Tuple of (sorted drone ids with a position, their positions as an (N, 3) view
+            into a buffer reused by the next call, position dictionaries by drone id)
+        """
+        # Everything drawn or checked within one simulation step shares one interpolation pass
+        if self._positions_key == self.current_time and self._positions_cache is not None:
+            return self._positions_cache
+        
+        drone_ids = []
         positions = {}
         
-        for drone_id, drone_data in self.drones.items():
-            trajectory = drone_data['trajectory']
-            if trajectory:
+        if len(self.drones) > len(self._positions_buffer):
+            self._positions_buffer = np.empty((len(self.drones), 3))
+        buffer = self._positions_buffer
+        
+        for drone_id in sorted(self.drones):
+            if self.drones[drone_id]['trajectory']:
                 position = self._get_drone_position_at_time(drone_id, self.current_time)
                 if position:
+                    buffer[len(drone_ids)] = (position['x'], position['y'], position['z'])
+                    drone_ids.append(drone_id)
                     positions[drone_id] = position
         
-        return positions
+        self._positions_key = self.current_time
+        self._positions_cache = (drone_ids, buffer[:len(drone_ids)], positions)
+        return self._positions_cache
     
     def _get_drone_position_at_time(self, drone_id: str, time: float) -> Optional[Dict]:
         """Get drone position at specific time with LOITER delays"""
@@ -639,72 +687,109 @@ class AdvancedDroneSimulator:
         if not trajectory:
             return None
         
-        # Apply LOITER delays
-        effective_time = time
-        for delay in self.drones[drone_id].get('loiter_delays', []):
-            if time >= delay['start_time']:
-                effective_time = max(delay['start_time'], time - delay['duration'])
-                break
+        # Apply LOITER delays and binary-search the precomputed time table in one compiled call
+        arrays = to_arrays(trajectory)
+        starts, durations = self._get_loiter_arrays(drone_id)
+        xyz = self._interp_buffer
+        effective_time, segment = interp_loiter(time, arrays.t, arrays.xyz, starts, durations, xyz)
         
-        # Interpolate position
-        return self.collision_system._interpolate_position(trajectory, effective_time)
+        # Boundary conditions (copies: positions are shared through the per-frame cache)
+        if segment < 0:
+            return dict(arrays.first_point)
+        if segment == len(arrays) - 1:
+            return dict(arrays.last_point)
+        
+        x, y, z = xyz.tolist()
+        return {'x': x, 'y': y, 'z': z, 'time': effective_time, 'phase': arrays.phase[segment].item()}
+    
+    def _get_loiter_arrays(self, drone_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the LOITER delay start times and durations of a drone as arrays,
+        rebuilding them only when the delay list has been replaced or grown
+        """
+        delays = self.drones[drone_id]['loiter_delays']
+        key = (id(delays), len(delays))
+        cached = self._loiter_arrays.get(drone_id)
+        if cached is None or cached[:2] != key:
+            starts = np.array([delay['start_time'] for delay in delays], dtype=np.float64)
+            durations = np.array([delay['duration'] for delay in delays], dtype=np.float64)
+            cached = (*key, starts, durations)
+            self._loiter_arrays[drone_id] = cached
+        return cached[2], cached[3]
     
     def _calculate_max_time(self) -> None:
         """Calculate maximum simulation time"""
-        self.max_time = 0.0
-        
-        for drone_data in self.drones.values():
-            trajectory = drone_data['trajectory']
-            if trajectory:
-                base_time = trajectory[-1]['time']
-                total_loiter = sum(delay['duration'] for delay in drone_data.get('loiter_delays', []))
-                drone_max_time = base_time + total_loiter
-                self.max_time = max(self.max_time, drone_max_time)
+        # Each drone ends after its trajectory plus all of its LOITER delays
+        flown = [drone_id for drone_id, drone_data in self.drones.items() if drone_data['trajectory']]
+        base_times = np.array([self.drones[drone_id]['trajectory'].t_max for drone_id in flown])
+        loiter_totals = np.array([self._get_loiter_arrays(drone_id)[1].sum() for drone_id in flown])
+        self.max_time = float((base_times + loiter_totals).max(initial=0.0))
         
         if self.max_time > 0:
             self.control_panel.get_widget('time_slider').config(to=self.max_time)
         
         logger.debug(f"Maximum simulation time: {self.max_time:.1f}s")
     
-    def _update_status_display(self) -> None:
-        """Update status text display"""
+    @staticmethod
+    def _format_status_prefix(drone_id: str, drone_data: Dict) -> str:
+        """Render the part of a drone's status block that never changes after loading"""
+        trajectory = drone_data['trajectory']
+        prefix = (f"🚁 {drone_id}:\n"
+                  f"   📍 Takeoff: {drone_data['takeoff_position']}\n"
+                  f"   📊 Waypoints: {len(drone_data['waypoints'])}\n")
+        if trajectory:
+            prefix += f"   ⏱️  Duration: {trajectory.t_max:.1f}s\n"
+        return prefix
+    
+    def _update_status_display(self, current_positions: Optional[Dict[str, Dict]] = None) -> None:
+        """
+        Update status text display
+        
+        Args:
+            current_positions: Position dictionaries by drone id at the current time;
+                taken from the per-step positions shared with the 3D plot when omitted
+        """
         if not self.control_panel:
             return
         
         if not self.drones:
-            self.control_panel.update_status_text("📄 No loaded drones\n\nLoad mission files or create test mission to begin.")
+            self._set_status_text("📄 No loaded drones\n\nLoad mission files or create test mission to begin.")
             return
         
-        status_lines = []
+        if current_positions is None:
+            current_positions = self._get_current_positions()[2]
+        
+        status_parts = self._status_parts
+        status_parts.clear()
         
         for drone_id, drone_data in self.drones.items():
-            trajectory = drone_data['trajectory']
-            current_pos = self._get_drone_position_at_time(drone_id, self.current_time)
-            
-            status_lines.append(f"🚁 {drone_id}:")
-            status_lines.append(f"   📍 Takeoff: {drone_data['takeoff_position']}")
-            status_lines.append(f"   📊 Waypoints: {len(drone_data['waypoints'])}")
-            
-            if trajectory:
-                status_lines.append(f"   ⏱️  Duration: {trajectory[-1]['time']:.1f}s")
+            current_pos = current_positions.get(drone_id)
+            block = drone_data['status_prefix']
             
             # LOITER delays
-            loiter_delays = drone_data.get('loiter_delays', [])
+            loiter_delays = drone_data['loiter_delays']
             if loiter_delays:
                 total_loiter = sum(delay['duration'] for delay in loiter_delays)
-                status_lines.append(f"   ⏸️  Wait Time: {total_loiter:.1f}s")
+                block += f"   ⏸️  Wait Time: {total_loiter:.1f}s\n"
             
             # Current status
             if current_pos:
-                phase_name = UILabels.PHASE_NAMES.get(current_pos.get('phase', FlightPhase.AUTO), "Executing")
-                status_lines.append(f"   🎯 Phase: {phase_name}")
-                status_lines.append(f"   📍 Position: ({current_pos['x']:.1f}, {current_pos['y']:.1f}, {current_pos['z']:.1f})")
+                phase_name = UILabels.PHASE_NAMES[current_pos['phase']]
+                block += (f"   🎯 Phase: {phase_name}\n"
+                          f"   📍 Position: ({current_pos['x']:.1f}, {current_pos['y']:.1f}, {current_pos['z']:.1f})\n")
             else:
-                status_lines.append(f"   🎯 Status: {UILabels.STANDBY}")
+                block += f"   🎯 Status: {UILabels.STANDBY}\n"
             
-            status_lines.append("")
+            status_parts.append(block)
         
-        self.control_panel.update_status_text("\n".join(status_lines))
+        self._set_status_text("\n".join(status_parts))
+    
+    def _set_status_text(self, text: str) -> None:
+        """Push status text to the panel, skipping the Tk redraw when nothing changed"""
+        if text == self._last_status_text:
+            return
+        self._last_status_text = text
+        self.control_panel.update_status_text(text)
     
     def _update_warning_display(self, warnings: List[Dict]) -> None:
         """Update collision warning display"""
@@ -726,23 +811,68 @@ class AdvancedDroneSimulator:
             
             self.control_panel.update_warning_text("\n".join(warning_lines), 'danger')
     
-    def _generate_modified_missions(self, loiter_commands: Dict[str, float]) -> None:
+    def _start_mission_regeneration(self) -> None:
+        """Hand the dirty drones' missions to the background worker so the frame returns immediately"""
+        conflict_infos = {}
+        waypoints = {}
+        for drone_id in self._dirty_loiter_drones:
+            if drone_id not in self.drones:
+                continue
+            drone_data = self.drones[drone_id]
+            delays = drone_data['loiter_delays']
+            
+            # Wait after the last waypoint reached when the first delay began
+            arrays = to_arrays(drone_data['trajectory'])
+            point = max(int(np.searchsorted(arrays.t, delays[0]['start_time'], side='right')) - 1, 0)
+            insert_after = min(max(int(arrays.wp_idx[point]), 2), len(drone_data['waypoints']))
+            
+            conflict_infos[drone_id] = {
+                'wait_time': sum(delay['duration'] for delay in delays),
+                'insert_after_waypoint': insert_after
+            }
+            waypoints[drone_id] = drone_data['waypoints']
+        self._dirty_loiter_drones = set()
+        
+        self._missions_executor.submit(
+            self._generate_modified_missions, conflict_infos, waypoints, self._missions_generation
+        )
+    
+    def _generate_modified_missions(self, conflict_infos: Dict[str, Dict],
+                                    waypoints: Dict[str, List[Dict]], generation: int) -> None:
         """Generate modified mission files with LOITER commands"""
-        for drone_id, loiter_time in loiter_commands.items():
-            if drone_id in self.drones:
-                waypoints = self.drones[drone_id]['waypoints']
-                loiter_list = [{'time': loiter_time}] if loiter_time > 0 else None
-                
-                mission_lines = self.qgc_generator.generate_complete_mission(
-                    drone_id, waypoints, loiter_list
+        # A private generator: its sequence counter must not be shared with the UI thread
+        generator = QGCWaypointGenerator()
+        
+        for drone_id, conflict_info in conflict_infos.items():
+            try:
+                mission_lines = generator.generate_complete_mission(
+                    drone_id, waypoints[drone_id], conflict_info
                 )
-                
+            except Exception as e:
+                logger.error(f"Failed to generate modified mission for {drone_id}: {e}")
+                continue
+            
+            with self._missions_lock:
+                if generation != self._missions_generation:
+                    return
                 self.modified_missions[drone_id] = mission_lines
-                logger.info(f"Generated modified mission for {drone_id} with {loiter_time:.1f}s LOITER")
+            logger.info(f"Generated modified mission for {drone_id} with "
+                        f"{conflict_info['wait_time']:.1f}s LOITER")
+    
+    def _clear_modified_missions(self) -> None:
+        """Drop modified missions and any regeneration still in flight"""
+        with self._missions_lock:
+            self.modified_missions.clear()
+            self._missions_generation += 1
+        self._dirty_loiter_drones = set()
+        self._exported_missions.clear()
     
     def export_modified_missions(self) -> None:
         """Export modified mission files"""
-        if not self.modified_missions:
+        with self._missions_lock:
+            modified_missions = dict(self.modified_missions)
+        
+        if not modified_missions:
             self.main_window.show_info(UILabels.EXPORT_INFO, "No modified mission files to export")
             return
         
@@ -751,16 +881,51 @@ class AdvancedDroneSimulator:
             return
         
         exported_files = []
+        # One timestamped suffix for the whole export batch
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = f"_{SimulatorConfig.MISSION_FILE_PREFIX}_{timestamp}.waypoints"
+        
+        # Missions unchanged since the last export are copied from the file written
+        # then (shutil.copyfile lets the kernel move the bytes where it can);
+        # only the others are encoded again
+        copies = {}
+        for drone_id, lines in modified_missions.items():
+            cached = self._exported_missions.get(drone_id)
+            if cached and cached[0] is lines:
+                try:
+                    if os.path.getsize(cached[1]) == cached[2]:
+                        copies[drone_id] = cached[1]
+                except OSError:
+                    pass
+        spans = self._encode_missions(
+            {drone_id: lines for drone_id, lines in modified_missions.items() if drone_id not in copies}
+        )
         
-        for drone_id, mission_lines in self.modified_missions.items():
-            filename = f"{drone_id}_{SimulatorConfig.MISSION_FILE_PREFIX}_{timestamp}.waypoints"
-            filepath = f"{export_dir}/{filename}"
-            
+        # All files are written at once so per-file open/write latency overlaps;
+        # each writer gets a slice of the shared export buffer
+        dir_path = Path(export_dir)
+        with memoryview(self._export_buffer) as buffer, \
+                ThreadPoolExecutor(max_workers=len(modified_missions)) as pool:
+            write_futures = []
+            for drone_id in modified_missions:
+                filename = drone_id + suffix
+                filepath = dir_path / filename
+                if drone_id in copies:
+                    source = copies[drone_id]
+                    size = self._exported_missions[drone_id][2]
+                    # Re-exporting to the same directory within a second: already written
+                    future = None if source == filepath else pool.submit(shutil.copyfile, source, filepath)
+                else:
+                    start, stop = spans[drone_id]
+                    size = stop - start
+                    future = pool.submit(filepath.write_bytes, buffer[start:stop])
+                write_futures.append((drone_id, filename, filepath, size, future))
+        
+        for drone_id, filename, filepath, size, future in write_futures:
             try:
-                with open(filepath, 'w', encoding=SimulatorConfig.EXPORT_ENCODING) as f:
-                    f.write('\n'.join(mission_lines))
-                
+                if future is not None:
+                    future.result()
+                self._exported_missions[drone_id] = (modified_missions[drone_id], filepath, size)
                 exported_files.append(filename)
                 logger.info(f"Exported modified mission: {filepath}")
                 
@@ -775,6 +940,80 @@ class AdvancedDroneSimulator:
         else:
             self.main_window.show_error("Export Failed", "Failed to export any mission files")
     
+    def _encode_missions(self, missions: Dict[str, List[str]]) -> Dict[str, Tuple[int, int]]:
+        """
+        Encode mission files back to back into the reusable export buffer
+        
+        Args:
+            missions: Mission lines by drone id
+            
+        Returns:
+            Byte range (start, stop) of each drone's file in the buffer
+        """
+        encoding = SimulatorConfig.EXPORT_ENCODING
+        
+        # Mission lines are ASCII, so character counts size the buffer exactly
+        needed = sum(len(line) + 1 for lines in missions.values() for line in lines)
+        if len(self._export_buffer) < needed:
+            self._export_buffer = bytearray(needed)
+        buffer = self._export_buffer
+        
+        spans = {}
+        offset = 0
+        for drone_id, lines in missions.items():
+            start = offset
+            for line in lines:
+                data = line.encode(encoding)
+                end = offset + len(data)
+                # Slice assignment also grows the buffer should a line not be ASCII
+                buffer[offset:end] = data
+                buffer[end:end + 1] = b'\n'
+                offset = end + 1
+            # Lines are newline-separated, without a trailing newline
+            spans[drone_id] = (start, max(start, offset - 1))
+        return spans
+    
+    def export_modified_missions_aggregated(self) -> None:
+        """Export all modified missions as members of a single tar archive"""
+        with self._missions_lock:
+            modified_missions = dict(self.modified_missions)
+        
+        if not modified_missions:
+            self.main_window.show_info(UILabels.EXPORT_INFO, "No modified mission files to export")
+            return
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = f"_{SimulatorConfig.MISSION_FILE_PREFIX}_{timestamp}.waypoints"
+        archive_path = filedialog.asksaveasfilename(
+            title="Save Mission Archive",
+            defaultextension=".tar",
+            initialfile=f"{SimulatorConfig.MISSION_ARCHIVE_PREFIX}_{timestamp}.tar",
+            filetypes=[("Tar archives", "*.tar"), ("All files", "*.*")]
+        )
+        if not archive_path:
+            return
+        
+        # One sequential stream instead of a file per drone
+        try:
+            mtime = int(time.time())
+            with tarfile.open(archive_path, 'w') as tar:
+                for drone_id, mission_lines in modified_missions.items():
+                    payload = '\n'.join(mission_lines).encode(SimulatorConfig.EXPORT_ENCODING)
+                    info = tarfile.TarInfo(drone_id + suffix)
+                    info.size = len(payload)
+                    info.mtime = mtime
+                    tar.addfile(info, io.BytesIO(payload))
+        except Exception as e:
+            logger.error(f"Failed to export mission archive: {e}")
+            self.main_window.show_error("Export Failed", f"Failed to export mission archive:\n{e}")
+            return
+        
+        logger.info(f"Exported {len(modified_missions)} modified missions to archive: {archive_path}")
+        self.main_window.show_info(
+            UILabels.EXPORT_SUCCESS,
+            f"Successfully exported {len(modified_missions)} modified missions to:\n{archive_path}"
+        )
+    
     def export_collision_log(self) -> None:
         """Export collision log"""
         if not self.collision_logger:
@@ -784,7 +1023,7 @@ class AdvancedDroneSimulator:
         export_file = filedialog.asksaveasfilename(
             title="Save Collision Log",
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json"), ("NDJSON files", "*.ndjson"), ("All files", "*.*")]
         )
         
         if export_file:
@@ -815,17 +1054,23 @@ class AdvancedDroneSimulator:
             # Generate modified missions
             for conflict in conflicts:
                 waiting_drone = conflict['waiting_drone']
-                if waiting_drone not in self.modified_missions:
-                    waypoints = self.drones[waiting_drone]['waypoints']
-                    mission_lines = self.qgc_generator.generate_mission_with_conflicts(
-                        waiting_drone, waypoints, [conflict]
-                    )
+                with self._missions_lock:
+                    if waiting_drone in self.modified_missions:
+                        continue
+                waypoints = self.drones[waiting_drone]['waypoints']
+                mission_lines = self.qgc_generator.generate_mission_with_conflicts(
+                    waiting_drone, waypoints, [conflict]
+                )
+                with self._missions_lock:
                     self.modified_missions[waiting_drone] = mission_lines
             
+            with self._missions_lock:
+                mission_count = len(self.modified_missions)
+            
             self.main_window.show_info(
                 "Conflict Analysis",
                 f"Found {len(conflicts)} trajectory conflicts\n"
-                f"Generated {len(self.modified_missions)} modified missions\n"
+                f"Generated {mission_count} modified missions\n"
                 f"Use 'Export Modified Missions' to save files"
             )
         else:
@@ -859,8 +1104,7 @@ class AdvancedDroneSimulator:
             if new_time is not None:
                 self.current_time = new_time
                 self.control_panel.update_time_display(self.current_time, self.max_time)
-                self._update_status_display()
-                self._update_3d_plot()
+                self._schedule_replot()
     
     def on_speed_change(self) -> None:
         """Handle speed change"""
@@ -873,11 +1117,27 @@ class AdvancedDroneSimulator:
         """Handle safety distance change"""
         new_safety = self.control_panel.get_variable_value('safety_var')
         if new_safety is not None:
-            self.safety_config.safety_distance = new_safety
+            # SafetyConfig is frozen, so swap in an updated copy
+            self.safety_config = replace(self.safety_config, safety_distance=new_safety)
+            self.collision_system.update_safety_config(self.safety_config)
             if not self.is_playing:
-                self._update_3d_plot()
+                self._schedule_replot()
             logger.debug(f"Safety distance changed to {new_safety:.1f}m")
     
+    def _schedule_replot(self) -> None:
+        """Request a status and 3D plot refresh, coalescing slider bursts into one per ~16 ms"""
+        if self._pending_replot is None:
+            self._pending_replot = self.main_window.get_window().after(16, self._flush_pending_replot)
+    
+    def _flush_pending_replot(self) -> None:
+        """Run the coalesced refresh for the latest slider values"""
+        self._pending_replot = None
+        
+        # While playing, the animation loop redraws on its own
+        if not self.is_playing:
+            self._update_status_display()
+            self._update_3d_plot()
+    
     def on_closing(self) -> None:
         """Handle application closing"""
         logger.info("🚪 Application closing")
@@ -896,9 +1156,9 @@ class AdvancedDroneSimulator:
                 try:
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     log_file = f"collision_log_{timestamp}.json"
-                    result = self.collision_logger.export_collision_log(log_file)
+                    result = self.collision_logger.export_collision_log(log_file, background=True)
                     if result:
-                        self.main_window.show_info("Export Success", f"Collision log saved to: {result}")
+                        self.main_window.show_info("Export Success", f"Collision log will be saved on exit to: {result}")
                 except Exception as e:
                     logger.error(f"Failed to export collision log on exit: {e}")
         
@@ -911,7 +1171,18 @@ class AdvancedDroneSimulator:
         
         self._stop_animation()
         
-        # Close matplotlib figures
+        # Drop a slider refresh that has not run yet
+        window = self.main_window.get_window() if self.main_window else None
+        if self._pending_replot is not None and window is not None:
+            window.after_cancel(self._pending_replot)
+        self._pending_replot = None
+        
+        self._missions_executor.shutdown(wait=False)
+        
+        # Queued collision log exports are not waited for here: the logger's
+        # write-back queue finishes them, time-bounded, as the interpreter exits
+        
+        # Close matplotlib figures (on this thread: the Tk backend is not thread-safe)
         try:
             import matplotlib.pyplot as plt
             plt.close('all')
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared test setup and fixtures
+"""
+
+# Load the config package first, as the application does: core modules import
+# config.settings, and the config package imports core in turn
+import config  # noqa: F401
+
+import pytest
+from typing import Dict, List, Tuple
+from config.settings import TakeoffConfig
+from core.coordinate_system import EarthCoordinateSystem
+from core.flight_manager import TakeoffManager
+
+BASE_LAT, BASE_LON = 24.0, 121.0
+
+# Mission area of each drone of the test mission (east, north offsets in meters)
+REGION_OFFSETS = [(-100, -50), (100, -50), (-100, 50), (100, 50)]
+
+
+@pytest.fixture
+def test_mission() -> Tuple[EarthCoordinateSystem, TakeoffConfig, Dict[str, List[Dict]]]:
+    """
+    The simulator's 2x2 formation test mission
+
+    Returns:
+        Tuple of (coordinate system with origin set, takeoff config, waypoints by drone id)
+    """
+    coordinate_system = EarthCoordinateSystem()
+    coordinate_system.set_origin(BASE_LAT, BASE_LON)
+    takeoff_config = TakeoffConfig()
+    takeoff_positions = TakeoffManager(takeoff_config, coordinate_system).generate_takeoff_formation(
+        BASE_LAT, BASE_LON)
+    base_x, base_y = coordinate_system.lat_lon_to_meters(BASE_LAT, BASE_LON)
+
+    missions = {}
+    for i, ((takeoff_lat, takeoff_lon), (offset_x, offset_y)) in enumerate(zip(takeoff_positions, REGION_OFFSETS)):
+        waypoints = [{'lat': takeoff_lat, 'lon': takeoff_lon, 'alt': 0, 'cmd': 179}]
+        for dx, dy in [(0, 0), (80, 0), (80, 80), (0, 80), (0, 0)]:
+            lat, lon = coordinate_system.meters_to_lat_lon(base_x + offset_x + dx, base_y + offset_y + dy)
+            waypoints.append({'lat': lat, 'lon': lon, 'alt': 15, 'cmd': 16})
+        missions[f"Drone_{i+1}"] = waypoints
+
+    return coordinate_system, takeoff_config, missions
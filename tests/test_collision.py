@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collision detection tests against the original scalar implementations
+"""
+
+import math
+import numpy as np
+import pytest
+from typing import Dict, List, Optional
+
+from config.settings import SafetyConfig, SimulatorConfig
+from core import _kernels, collision_avoidance
+from core.collision_avoidance import CollisionAvoidanceSystem
+from core.collision_logger import CollisionLogger
+from core.trajectory import TrajectoryArrays, build_flight_trajectory
+
+
+def _make_system(safety_distance: float = 5.0) -> CollisionAvoidanceSystem:
+    """Collision system with its own logger"""
+    config = SafetyConfig(safety_distance=safety_distance, critical_distance=min(3.0, safety_distance))
+    return CollisionAvoidanceSystem(config, CollisionLogger())
+
+
+def _as_points(arrays: TrajectoryArrays) -> List[Dict]:
+    """Trajectory arrays as the original list of point dictionaries"""
+    return [{'time': t, 'x': x, 'y': y, 'z': z, 'waypoint_index': i}
+            for t, (x, y, z), i in zip(arrays.t.tolist(), arrays.xyz.tolist(), arrays.wp_idx.tolist())]
+
+
+def _reference_interpolate(trajectory: List[Dict], time: float) -> Optional[Dict]:
+    """Original linear scan interpolation (CollisionAvoidanceSystem._interpolate_position)"""
+    if time >= trajectory[-1]['time']:
+        return trajectory[-1]
+    if time <= trajectory[0]['time']:
+        return trajectory[0]
+    for i in range(len(trajectory) - 1):
+        t1, t2 = trajectory[i]['time'], trajectory[i + 1]['time']
+        if t1 <= time <= t2:
+            if t2 - t1 == 0:
+                return trajectory[i]
+            ratio = (time - t1) / (t2 - t1)
+            return {k: trajectory[i][k] + ratio * (trajectory[i + 1][k] - trajectory[i][k]) for k in 'xyz'}
+    return None
+
+
+def _reference_nearest_waypoint_index(trajectory: List[Dict], time: float) -> int:
+    """Original nearest waypoint scan (CollisionAvoidanceSystem._find_nearest_waypoint_index)"""
+    min_diff = float('inf')
+    nearest_idx = 0
+    for i, point in enumerate(trajectory):
+        if 'waypoint_index' in point:
+            time_diff = abs(point['time'] - time)
+            if time_diff < min_diff:
+                min_diff = time_diff
+                nearest_idx = point.get('waypoint_index', i)
+    return nearest_idx
+
+
+def _distance(pos1: Dict, pos2: Dict) -> float:
+    return math.sqrt((pos1['x'] - pos2['x'])**2 + (pos1['y'] - pos2['y'])**2 + (pos1['z'] - pos2['z'])**2)
+
+
+def _reference_check_collisions(positions: Dict[str, Dict], config: SafetyConfig) -> List[Dict]:
+    """Original all-pairs check (CollisionAvoidanceSystem.check_collisions), warnings only"""
+    warnings = []
+    drone_ids = sorted(positions.keys())
+    for i in range(len(drone_ids)):
+        for j in range(i + 1, len(drone_ids)):
+            pos1, pos2 = positions[drone_ids[i]], positions[drone_ids[j]]
+            if pos1 and pos2:
+                distance = _distance(pos1, pos2)
+                if distance < config.safety_distance:
+                    warnings.append({
+                        'drone1': drone_ids[i],
+                        'drone2': drone_ids[j],
+                        'distance': distance,
+                        'position': tuple((pos1[k] + pos2[k]) / 2 for k in 'xyz'),
+                        'severity': 'critical' if distance < config.critical_distance else 'warning'
+                    })
+    return warnings
+
+
+def _random_positions(count: int, extent: float, seed: int) -> Dict[str, Dict]:
+    """Drone positions spread uniformly over a cube, a few of them missing"""
+    rng = np.random.default_rng(seed)
+    positions = {f"Drone_{i+1:03d}": dict(zip('xyz', rng.uniform(0.0, extent, 3).tolist()))
+                 for i in range(count)}
+    positions['Drone_999'] = None
+    return positions
+
+
+def _assert_warnings_match(warnings: List[Dict], expected: List[Dict]) -> None:
+    assert [(w['drone1'], w['drone2']) for w in warnings] == [(w['drone1'], w['drone2']) for w in expected]
+    for warning, reference in zip(warnings, expected):
+        assert warning['distance'] == pytest.approx(reference['distance'], abs=1e-9)
+        assert warning['position'] == pytest.approx(reference['position'], abs=1e-9)
+        assert warning['severity'] == reference['severity']
+
+
+def _near_pairs_variants():
+    """NumPy and (when numba is installed) JIT versions of the near-pair kernel"""
+    variants = [_kernels._near_pairs_numpy]
+    if _kernels.NUMBA_AVAILABLE:
+        variants.append(_kernels._near_pairs_jit)
+    return variants
+
+
+@pytest.mark.parametrize('kernel', _near_pairs_variants())
+@pytest.mark.parametrize('seed', range(5))
+def test_check_collisions_dense_matches_reference(monkeypatch, kernel, seed):
+    monkeypatch.setattr(collision_avoidance, 'near_pairs', kernel)
+    positions = _random_positions(15, 15.0, seed)
+    system = _make_system()
+
+    warnings, new_loiters = system.check_collisions(positions, 12.5)
+
+    _assert_warnings_match(warnings, _reference_check_collisions(positions, system.config))
+    assert warnings and new_loiters == {}
+    assert all(w['time'] == 12.5 for w in warnings)
+
+
+def test_check_collisions_growing_swarm_matches_reference():
+    # The pair buffers are sized for the first check and must grow with the swarm
+    system = _make_system()
+    for seed, count in enumerate([4, 15, 48]):
+        positions = _random_positions(count, 40.0, seed)
+
+        warnings, _ = system.check_collisions(positions, float(seed))
+
+        _assert_warnings_match(warnings, _reference_check_collisions(positions, system.config))
+
+
+def test_find_trajectory_conflicts_reports_reference_values(test_mission):
+    coordinate_system, takeoff_config, missions = test_mission
+    trajectories = {drone_id: build_flight_trajectory(waypoints, coordinate_system, takeoff_config,
+                                                      SimulatorConfig.DEFAULT_CRUISE_SPEED)
+                    for drone_id, waypoints in missions.items()}
+    system = _make_system(safety_distance=15.0)
+    drone_ids = sorted(trajectories)
+
+    found = 0
+    for i, drone1 in enumerate(drone_ids):
+        for drone2 in drone_ids[i + 1:]:
+            conflicts = system._find_trajectory_conflicts(drone1, trajectories[drone1],
+                                                          drone2, trajectories[drone2])
+            points1, points2 = _as_points(trajectories[drone1]), _as_points(trajectories[drone2])
+            for conflict in conflicts:
+                t = conflict['time']
+                pos1 = _reference_interpolate(points1, t)
+                pos2 = _reference_interpolate(points2, t)
+                distance = _distance(pos1, pos2)
+
+                assert (conflict['drone1'], conflict['drone2']) == (drone1, drone2)
+                assert distance < system.config.safety_distance
+                assert conflict['distance'] == pytest.approx(distance, abs=1e-9)
+                assert [conflict['position1'][k] for k in 'xyz'] == pytest.approx([pos1[k] for k in 'xyz'])
+                assert [conflict['position2'][k] for k in 'xyz'] == pytest.approx([pos2[k] for k in 'xyz'])
+                assert conflict['waypoint1_index'] == _reference_nearest_waypoint_index(points1, t)
+                assert conflict['waypoint2_index'] == _reference_nearest_waypoint_index(points2, t)
+                assert conflict['severity'] == ('critical' if distance < system.config.critical_distance
+                                                else 'warning')
+            found += len(conflicts)
+    assert found
+
+
+def _fixed_grid_conflict_times(arrays1: TrajectoryArrays, arrays2: TrajectoryArrays,
+                               safety_distance: float) -> List[float]:
+    """Conflict sample times of the original fixed 0.5s sweep (_find_trajectory_conflicts)"""
+    points1, points2 = _as_points(arrays1), _as_points(arrays2)
+    max_time = max(arrays1.t_max, arrays2.t_max)
+    return [t for t in np.arange(0, max_time, 0.5).tolist()
+            if _distance(_reference_interpolate(points1, t), _reference_interpolate(points2, t)) < safety_distance]
+
+
+@pytest.mark.parametrize('safety_distance', [5.0, 6.5, 8.0, 10.0, 12.0, 15.0])
+def test_adaptive_sampling_keeps_conflict_pairs_and_onsets(test_mission, safety_distance):
+    # Adaptive sampling yields different (fewer) samples than the fixed grid, but the
+    # conflicting pairs and the first conflict time of each pair, which drive the
+    # LOITER wait times, must stay the same
+    coordinate_system, takeoff_config, missions = test_mission
+    trajectories = {drone_id: build_flight_trajectory(waypoints, coordinate_system, takeoff_config,
+                                                      SimulatorConfig.DEFAULT_CRUISE_SPEED)
+                    for drone_id, waypoints in missions.items()}
+    system = _make_system(safety_distance)
+    drone_ids = sorted(trajectories)
+
+    for i, drone1 in enumerate(drone_ids):
+        for drone2 in drone_ids[i + 1:]:
+            conflicts = system._find_trajectory_conflicts(drone1, trajectories[drone1],
+                                                          drone2, trajectories[drone2])
+            reference = _fixed_grid_conflict_times(trajectories[drone1], trajectories[drone2], safety_distance)
+
+            assert bool(conflicts) == bool(reference), (drone1, drone2)
+            if reference:
+                assert conflicts[0]['time'] == pytest.approx(reference[0], abs=1e-9), (drone1, drone2)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collision log export and import round-trip tests
+"""
+
+import json
+import numpy as np
+import pytest
+
+from core import collision_logger
+from core.collision_logger import CollisionLogger
+
+
+def _serializers():
+    """Serializer settings to test: the json fallback, and orjson when it is installed"""
+    options = [False]
+    if collision_logger.ORJSON_AVAILABLE:
+        options.append(True)
+    return options
+
+
+def _make_logger() -> CollisionLogger:
+    """Logger with real-time and trajectory analysis events, including NumPy values and non-ASCII names"""
+    logger = CollisionLogger()
+    logger.log_collision({
+        'time': np.float64(12.5), 'drone1': 'Drone_1', 'drone2': 'Drone_2',
+        'distance': np.float64(2.25), 'severity': 'critical',
+        'position1': {'x': 1.0, 'y': 2.0, 'z': 15.0}, 'position2': {'x': 2.5, 'y': 2.0, 'z': 14.0},
+        'waypoint1_index': 3, 'waypoint2_index': 4
+    })
+    logger.log_collisions_bulk([
+        {'time': t, 'drone1': 'Drone_3', 'drone2': '無人機_4', 'distance': 4.0 + t / 10,
+         'severity': 'warning', 'position1': (0.0, t, 10.0), 'position2': [1.0, t, 10.0]}
+        for t in (0.0, 0.5, 1.0)
+    ])
+    return logger
+
+
+def _plain(events):
+    """Events as they read back from JSON (tuples become lists, NumPy scalars plain numbers)"""
+    return json.loads(json.dumps(events, default=float))
+
+
+@pytest.mark.parametrize('use_orjson', _serializers())
+@pytest.mark.parametrize('extension', ['.json', '.ndjson'])
+def test_export_import_round_trip(tmp_path, monkeypatch, use_orjson, extension):
+    monkeypatch.setattr(collision_logger, 'ORJSON_AVAILABLE', use_orjson)
+    source = _make_logger()
+    path = str(tmp_path / f"collisions{extension}")
+
+    assert source.export_collision_log(path) == path
+
+    imported = CollisionLogger()
+    assert imported.import_collision_log(path)
+    assert imported.collision_events == _plain(source.collision_events)
+
+
+@pytest.mark.parametrize('use_orjson', _serializers())
+def test_json_export_layout(tmp_path, monkeypatch, use_orjson):
+    monkeypatch.setattr(collision_logger, 'ORJSON_AVAILABLE', use_orjson)
+    source = _make_logger()
+    path = tmp_path / "collisions.json"
+    source.export_collision_log(str(path))
+
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data['metadata']['total_events'] == 4
+    assert data['metadata']['statistics'] == _plain(source.get_collision_statistics())
+    assert data['collision_events'] == _plain(source.collision_events)
+    assert '無人機_4' in path.read_text(encoding='utf-8')
+
+
+@pytest.mark.parametrize('use_orjson', _serializers())
+def test_ndjson_export_layout(tmp_path, monkeypatch, use_orjson):
+    monkeypatch.setattr(collision_logger, 'ORJSON_AVAILABLE', use_orjson)
+    source = _make_logger()
+    path = tmp_path / "collisions.ndjson"
+    source.export_collision_log(str(path))
+
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert records[0]['metadata']['total_events'] == 4
+    assert records[1:] == _plain(source.collision_events)
+
+
+def test_export_includes_events_logged_after_an_earlier_export(tmp_path):
+    source = _make_logger()
+    source.export_collision_log(str(tmp_path / "first.json"))
+    source.log_collision({'time': 30.0, 'drone1': 'Drone_1', 'drone2': 'Drone_4',
+                          'distance': 1.0, 'severity': 'critical'})
+    source.export_collision_log(str(tmp_path / "second.json"))
+
+    imported = CollisionLogger()
+    assert imported.import_collision_log(str(tmp_path / "second.json"))
+    assert imported.collision_events == _plain(source.collision_events)
+
+    # Clearing drops the serialized rows along with the events
+    source.clear_events()
+    source.log_collision({'time': 1.0, 'drone1': 'A', 'drone2': 'B', 'distance': 4.0, 'severity': 'warning'})
+    source.export_collision_log(str(tmp_path / "third.json"))
+    data = json.loads((tmp_path / "third.json").read_text(encoding='utf-8'))
+    assert [event['drone1'] for event in data['collision_events']] == ['A']
+
+
+@pytest.mark.parametrize('extension', ['.json', '.ndjson'])
+def test_background_export_round_trip(tmp_path, extension):
+    source = _make_logger()
+    path = str(tmp_path / f"collisions{extension}")
+
+    assert source.export_collision_log(path, background=True) == path
+    # Events logged after queueing the export are not part of it
+    source.log_collision({'time': 99.0, 'drone1': 'X', 'drone2': 'Y', 'distance': 1.0, 'severity': 'critical'})
+    assert source.flush_exports(timeout=10.0)
+
+    imported = CollisionLogger()
+    assert imported.import_collision_log(path)
+    assert imported.collision_events == _plain(source.collision_events[:-1])
+
+
+def test_export_without_events_returns_none(tmp_path):
+    assert CollisionLogger().export_collision_log(str(tmp_path / "empty.json")) is None
+    assert not (tmp_path / "empty.json").exists()
+
+
+def test_background_export_leaves_no_partial_file(tmp_path):
+    source = _make_logger()
+    path = tmp_path / "collisions.json"
+
+    def failing_write(f):
+        f.write(b'{"metadata": ')
+        raise OSError("disk full")
+
+    source._write_back.enqueue(str(path), failing_write)
+    assert source.flush_exports(timeout=10.0)
+    assert list(tmp_path.iterdir()) == []
+
+    source.export_collision_log(str(path), background=True)
+    assert source.flush_exports(timeout=10.0)
+    assert [p.name for p in tmp_path.iterdir()] == ["collisions.json"]
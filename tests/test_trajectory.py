@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trajectory builder and LOITER interpolation tests against the original scalar implementations
+"""
+
+import math
+import numpy as np
+import pytest
+from typing import Dict, List, Optional
+
+from config.settings import FlightPhase, SimulatorConfig
+from core import _kernels
+from core.trajectory import build_flight_trajectory
+
+
+def _reference_trajectory(waypoints: List[Dict], coordinate_system, takeoff_config,
+                          speed: float) -> List[Dict]:
+    """Original point-by-point trajectory builder (AdvancedDroneSimulator._calculate_realistic_trajectory)"""
+    trajectory = []
+    if len(waypoints) < 2:
+        return trajectory
+
+    home_wp = waypoints[0]
+    home_x, home_y = coordinate_system.lat_lon_to_meters(home_wp['lat'], home_wp['lon'])
+    trajectory.append({
+        'x': home_x, 'y': home_y, 'z': 0,
+        'time': 0.0, 'phase': FlightPhase.TAXI,
+        'lat': home_wp['lat'], 'lon': home_wp['lon'], 'alt': 0,
+        'waypoint_index': 0
+    })
+
+    takeoff_time = 2.0
+    climb_duration = 5.0
+    for i, t in enumerate(np.linspace(takeoff_time, takeoff_time + climb_duration, 20)):
+        altitude = (t - takeoff_time) / climb_duration * takeoff_config.takeoff_altitude
+        trajectory.append({
+            'x': home_x, 'y': home_y, 'z': altitude,
+            'time': t, 'phase': FlightPhase.TAKEOFF,
+            'waypoint_index': 0 if i < 10 else 1
+        })
+
+    total_time = takeoff_time + climb_duration + takeoff_config.hover_time
+    trajectory.append({
+        'x': home_x, 'y': home_y, 'z': takeoff_config.takeoff_altitude,
+        'time': total_time, 'phase': FlightPhase.HOVER,
+        'waypoint_index': 1
+    })
+
+    prev_x, prev_y, prev_z = home_x, home_y, takeoff_config.takeoff_altitude
+    for wp_idx, wp in enumerate(waypoints[1:], start=2):
+        x, y = coordinate_system.lat_lon_to_meters(wp['lat'], wp['lon'])
+        z = wp['alt']
+        distance = math.sqrt((x - prev_x)**2 + (y - prev_y)**2 + (z - prev_z)**2)
+        flight_time = distance / speed
+        total_time += flight_time
+
+        if distance > 10:
+            num_segments = max(2, int(distance / 10))
+            for seg in range(1, num_segments):
+                ratio = seg / num_segments
+                trajectory.append({
+                    'x': prev_x + ratio * (x - prev_x),
+                    'y': prev_y + ratio * (y - prev_y),
+                    'z': prev_z + ratio * (z - prev_z),
+                    'time': total_time - flight_time + (flight_time * ratio), 'phase': FlightPhase.AUTO,
+                    'waypoint_index': wp_idx - 1
+                })
+
+        trajectory.append({
+            'x': x, 'y': y, 'z': z,
+            'time': total_time, 'phase': FlightPhase.AUTO,
+            'lat': wp['lat'], 'lon': wp['lon'], 'alt': wp['alt'],
+            'waypoint_index': wp_idx
+        })
+        prev_x, prev_y, prev_z = x, y, z
+
+    return trajectory
+
+
+def _reference_interpolate(trajectory: List[Dict], time: float) -> Optional[Dict]:
+    """Original linear scan interpolation (CollisionAvoidanceSystem._interpolate_position)"""
+    if time >= trajectory[-1]['time']:
+        return trajectory[-1]
+    if time <= trajectory[0]['time']:
+        return trajectory[0]
+    for i in range(len(trajectory) - 1):
+        t1, t2 = trajectory[i]['time'], trajectory[i + 1]['time']
+        if t1 <= time <= t2:
+            if t2 - t1 == 0:
+                return trajectory[i]
+            ratio = (time - t1) / (t2 - t1)
+            return {k: trajectory[i][k] + ratio * (trajectory[i + 1][k] - trajectory[i][k]) for k in 'xyz'}
+    return None
+
+
+def _reference_loiter_time(time: float, delays: List[Dict]) -> float:
+    """Original LOITER time shift (AdvancedDroneSimulator._get_drone_position_at_time)"""
+    for delay in delays:
+        if time >= delay['start_time']:
+            return max(delay['start_time'], time - delay['duration'])
+    return time
+
+
+def _odd_missions(coordinate_system) -> Dict[str, List[Dict]]:
+    """Missions with short legs, climbs and descents next to the rectangular test pattern"""
+    def mission(points):
+        waypoints = []
+        for x, y, alt in points:
+            lat, lon = coordinate_system.meters_to_lat_lon(x, y)
+            waypoints.append({'lat': lat, 'lon': lon, 'alt': alt})
+        return waypoints
+
+    return {
+        'two_waypoints': mission([(0, 0, 0), (35, -12, 20)]),
+        'short_legs': mission([(5, 5, 0), (9, 5, 10), (9, 12, 10), (15, 12, 12)]),
+        'climb_and_descent': mission([(0, 0, 0), (0, 0, 40), (150, 30, 5), (150, 31, 5), (-40, 200, 60)]),
+    }
+
+
+def _kernel_variants(name: str):
+    """NumPy and (when numba is installed) JIT versions of a kernel"""
+    variants = [getattr(_kernels, f"_{name}_numpy")]
+    if _kernels.NUMBA_AVAILABLE:
+        variants.append(getattr(_kernels, f"_{name}_jit"))
+    return variants
+
+
+def test_build_flight_trajectory_matches_reference(test_mission):
+    coordinate_system, takeoff_config, missions = test_mission
+    missions = {**missions, **_odd_missions(coordinate_system)}
+    speed = SimulatorConfig.DEFAULT_CRUISE_SPEED
+
+    for drone_id, waypoints in missions.items():
+        arrays = build_flight_trajectory(waypoints, coordinate_system, takeoff_config, speed)
+        reference = _reference_trajectory(waypoints, coordinate_system, takeoff_config, speed)
+
+        assert len(arrays) == len(reference), drone_id
+        np.testing.assert_allclose(arrays.t, [p['time'] for p in reference], rtol=1e-12, atol=1e-9)
+        np.testing.assert_allclose(arrays.xyz, [[p['x'], p['y'], p['z']] for p in reference],
+                                   rtol=1e-12, atol=1e-6)
+        np.testing.assert_array_equal(arrays.wp_idx, [p['waypoint_index'] for p in reference])
+        np.testing.assert_array_equal(arrays.phase, [p['phase'] for p in reference])
+
+        for point, expected in ((arrays.first_point, reference[0]), (arrays.last_point, reference[-1])):
+            assert point.keys() == expected.keys()
+            for key, value in expected.items():
+                assert point[key] == pytest.approx(value, abs=1e-6), (drone_id, key)
+
+
+def test_build_flight_trajectory_needs_two_waypoints(test_mission):
+    coordinate_system, takeoff_config, missions = test_mission
+    arrays = build_flight_trajectory(missions['Drone_1'][:1], coordinate_system, takeoff_config,
+                                     SimulatorConfig.DEFAULT_CRUISE_SPEED)
+    assert len(arrays) == 0
+
+
+@pytest.mark.parametrize('kernel', _kernel_variants('interp_loiter'))
+def test_interp_loiter_matches_reference(test_mission, kernel):
+    coordinate_system, takeoff_config, missions = test_mission
+    arrays = build_flight_trajectory(missions['Drone_2'], coordinate_system, takeoff_config,
+                                     SimulatorConfig.DEFAULT_CRUISE_SPEED)
+    reference = _reference_trajectory(missions['Drone_2'], coordinate_system, takeoff_config,
+                                      SimulatorConfig.DEFAULT_CRUISE_SPEED)
+
+    delay_sets = [
+        [],
+        [{'start_time': 12.0, 'duration': 4.5}],
+        # Later delays come first, as they are appended while the simulation runs backwards
+        [{'start_time': 40.0, 'duration': 3.0}, {'start_time': 15.0, 'duration': 10.0}],
+    ]
+    out = np.empty(3)
+    for delays in delay_sets:
+        starts = np.array([d['start_time'] for d in delays], dtype=np.float64)
+        durations = np.array([d['duration'] for d in delays], dtype=np.float64)
+        for time in np.concatenate(([-1.0, 0.0], np.arange(0.05, arrays.t_max + 20.0, 0.37))):
+            effective_time, segment = kernel(time, arrays.t, arrays.xyz, starts, durations, out)
+            expected_time = _reference_loiter_time(time, delays)
+            assert effective_time == pytest.approx(expected_time, abs=1e-12)
+
+            expected = _reference_interpolate(reference, expected_time)
+            if segment < 0:
+                position = arrays.xyz[0]
+            elif segment == len(arrays) - 1:
+                position = arrays.xyz[-1]
+            else:
+                position = out
+            np.testing.assert_allclose(position, [expected[k] for k in 'xyz'], atol=1e-6)
@@ -5,13 +5,91 @@ Logging Configuration Module
 Professional logging setup for drone simulator v5.1
 """
 
+import gzip
 import logging
 import logging.handlers
 import os
+import shutil
 import sys
+import time
 from datetime import datetime
+from time import perf_counter_ns
 from typing import Optional
 
+# Records held in memory before a buffered file handler writes them out
+LOG_BUFFER_CAPACITY = 1024
+
+class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that gzip-compresses each rolled-over backup"""
+    
+    def rotation_filename(self, default_name: str) -> str:
+        """Name backups with a .gz suffix"""
+        return default_name + ".gz"
+    
+    def rotate(self, source: str, dest: str) -> None:
+        """Compress the closed log file into its backup and remove the original"""
+        if not os.path.exists(source):
+            return
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb', compresslevel=1) as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+class DurableAppendHandler(logging.handlers.MemoryHandler):
+    """
+    Buffered handler appending each batch to a file opened with O_APPEND | O_DSYNC
+    
+    Records are held as in a MemoryHandler and written out with one write per
+    flush; with O_DSYNC that write returns once the data is on disk, so no separate
+    fsync is needed. Where O_DSYNC does not exist (Windows) batches are just appended.
+    """
+    
+    def __init__(self, filename: str, capacity: int, flushLevel: int = logging.ERROR,
+                 encoding: str = 'utf-8'):
+        super().__init__(capacity, flushLevel=flushLevel)
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        flags = (os.O_WRONLY | os.O_CREAT | os.O_APPEND |
+                 getattr(os, 'O_DSYNC', 0) | getattr(os, 'O_BINARY', 0))
+        self._fd: Optional[int] = os.open(self.baseFilename, flags, 0o644)
+    
+    def flush(self) -> None:
+        """Write all buffered records with a single write"""
+        self.acquire()
+        try:
+            if not self.buffer:
+                return
+            records, self.buffer = self.buffer, []
+            if self._fd is None:
+                return
+            
+            lines = []
+            for record in records:
+                try:
+                    lines.append(self.format(record))
+                    lines.append('\n')
+                except Exception:
+                    self.handleError(record)
+            
+            try:
+                data = memoryview(''.join(lines).encode(self.encoding))
+                while data:
+                    data = data[os.write(self._fd, data):]
+            except Exception:
+                self.handleError(records[-1])
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        """Flush pending records and close the file"""
+        self.acquire()
+        try:
+            super().close()
+        finally:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            self.release()
+
 def setup_logging(
     log_level: str = "INFO",
     log_to_file: bool = True,
@@ -68,7 +146,7 @@ def setup_logging(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_filename = os.path.join(log_dir, f"drone_simulator_{timestamp}.log")
         
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = CompressedRotatingFileHandler(
             log_filename,
             maxBytes=max_file_size,
             backupCount=backup_count,
@@ -113,40 +191,59 @@ def log_performance(func):
     """
     Decorator to log function performance
     
+    Timing only happens while DEBUG is enabled for the function's module logger;
+    otherwise the wrapper just calls through, logging failures. Already wrapped
+    functions are returned unchanged.
+    
     Args:
         func: Function to monitor
         
     Returns:
         Wrapped function with performance logging
     """
-    import time
     import functools
     
+    if getattr(func, '__is_perf_wrapped__', False):
+        return func
+    
+    logger = logging.getLogger(func.__module__)
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        start_time = time.time()
+        # isEnabledFor is cached by the logging module, so the fast path is one dict lookup
+        if not logger.isEnabledFor(logging.DEBUG):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"💥 {func.__name__} failed: {e}")
+                raise
+        
+        start_ns = perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            elapsed_ns = perf_counter_ns() - start_ns
             
-            if execution_time > 0.1:  # Only log if execution takes more than 100ms
-                logger.debug(f"⏱️  {func.__name__} executed in {execution_time:.3f}s")
+            if elapsed_ns > 100_000_000:  # Only log if execution takes more than 100ms
+                logger.debug(f"⏱️  {func.__name__} executed in {elapsed_ns / 1e9:.3f}s")
             
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"💥 {func.__name__} failed after {execution_time:.3f}s: {e}")
+            elapsed_ns = perf_counter_ns() - start_ns
+            logger.error(f"💥 {func.__name__} failed after {elapsed_ns / 1e9:.3f}s: {e}")
             raise
     
+    wrapper.__is_perf_wrapped__ = True
     return wrapper
 
 def log_method_calls(cls):
     """
     Class decorator to log all method calls
     
+    Only methods defined on the class itself are wrapped; inherited ones were
+    wrapped (or deliberately left alone) where they are defined.
+    
     Args:
         cls: Class to monitor
         
@@ -155,9 +252,13 @@ def log_method_calls(cls):
     """
     logger = logging.getLogger(cls.__module__)
     
-    for attr_name in dir(cls):
-        attr = getattr(cls, attr_name)
-        if callable(attr) and not attr_name.startswith('_'):
+    for attr_name, attr in list(cls.__dict__.items()):
+        if attr_name.startswith('_'):
+            continue
+        if isinstance(attr, (staticmethod, classmethod)):
+            # Wrap the underlying function and keep the descriptor kind
+            setattr(cls, attr_name, type(attr)(log_performance(attr.__func__)))
+        elif callable(attr):
             setattr(cls, attr_name, log_performance(attr))
     
     logger.debug(f"🔍 Method call logging enabled for {cls.__name__}")
@@ -179,6 +280,26 @@ class LogContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.logger.setLevel(self.old_level)
 
+class MicrosecondFormatter(logging.Formatter):
+    """
+    Formatter with microsecond timestamps
+    
+    time.strftime has no %f, so the date format only covers whole seconds; that
+    part is formatted once per second and the microseconds are appended per record.
+    """
+    
+    def __init__(self, fmt: str = None, datefmt: str = '%Y-%m-%d %H:%M:%S'):
+        super().__init__(fmt, datefmt)
+        self._cached_second: Optional[int] = None
+        self._cached_prefix = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime(datefmt or self.datefmt, self.converter(second))
+        return f"{self._cached_prefix}.{int((record.created - second) * 1e6):06d}"
+
 class CollisionEventFilter(logging.Filter):
     """Custom filter for collision events"""
     
@@ -209,14 +330,15 @@ def setup_collision_logging(log_dir: str = "logs") -> logging.Logger:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     collision_log_file = os.path.join(log_dir, f"collision_events_{timestamp}.log")
     
-    collision_handler = logging.FileHandler(collision_log_file, encoding='utf-8')
+    # Batch event writes, each batch durable once written; errors (critical
+    # collisions) go out immediately
+    collision_handler = DurableAppendHandler(
+        collision_log_file, LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, encoding='utf-8'
+    )
     collision_handler.setLevel(logging.DEBUG)
     
     # Collision-specific formatter
-    collision_formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S.%f'
-    )
+    collision_formatter = MicrosecondFormatter('%(asctime)s | %(levelname)s | %(message)s')
     collision_handler.setFormatter(collision_formatter)
     
     # Add filter
@@ -250,6 +372,7 @@ def log_system_info():
     
     # CPU information
     logger.info(f"   CPU Cores: {psutil.cpu_count()}")
+    # Sampled over one second; this runs on a background thread, so the wait blocks no UI
     logger.info(f"   CPU Usage: {psutil.cpu_percent(interval=1)}%")
 
 def cleanup_old_logs(log_dir: str = "logs", days_to_keep: int = 30):
@@ -260,9 +383,6 @@ def cleanup_old_logs(log_dir: str = "logs", days_to_keep: int = 30):
         log_dir: Directory containing log files
         days_to_keep: Number of days of logs to keep
     """
-    import glob
-    import time
-    
     logger = logging.getLogger(__name__)
     
     if not os.path.exists(log_dir):
@@ -271,14 +391,18 @@ def cleanup_old_logs(log_dir: str = "logs", days_to_keep: int = 30):
     cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
     deleted_count = 0
     
-    for log_file in glob.glob(os.path.join(log_dir, "*.log*")):
-        if os.path.getmtime(log_file) < cutoff_time:
+    # One directory pass; DirEntry caches what the directory read already returned
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if '.log' not in entry.name or entry.name.startswith('.') or not entry.is_file():
+                continue
             try:
-                os.remove(log_file)
-                deleted_count += 1
-                logger.debug(f"🗑️  Deleted old log file: {log_file}")
+                if entry.stat().st_mtime < cutoff_time:
+                    os.remove(entry.path)
+                    deleted_count += 1
+                    logger.debug(f"🗑️  Deleted old log file: {entry.path}")
             except Exception as e:
-                logger.warning(f"Failed to delete log file {log_file}: {e}")
+                logger.warning(f"Failed to delete log file {entry.path}: {e}")
     
     if deleted_count > 0:
         logger.info(f"🧹 Cleaned up {deleted_count} old log files (older than {days_to_keep} days)")